@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from textwrap import indent
 from pathlib import Path
 
+import copy
 import hashlib
 import re
 
@@ -426,6 +427,29 @@ def run_acw(pl, writer_prompt: str) -> PatchBlock:
           (ex. `dto` si retour dict détecté, sinon `function`) pour produire une tâche valide.
         - Tous les autres champs sont passés tels quels si présents (tolérance MVP).
     """
+    arch_context, arch_context_text = _load_arch_context()
+    return _run_acw_with_context(pl, writer_prompt, arch_context, arch_context_text)
+
+
+def run_acw_batch(plan_lines: List[Any], writer_prompts: List[str]) -> List[PatchBlock]:
+    """
+    Forme lot de `run_acw` : un PatchBlock par (PlanLine, prompt), dans l'ordre.
+
+    Le contexte global (snapshot + version texte) est chargé une seule fois
+    pour tout le lot au lieu d'une fois par PlanLine ; chaque PatchBlock reçoit
+    sa propre copie du dict (aucun état partagé entre les PatchBlocks).
+    """
+    if len(plan_lines) != len(writer_prompts):
+        raise ValueError("run_acw_batch: autant de prompts que de PlanLines attendus.")
+    arch_context, arch_context_text = _load_arch_context()
+    return [
+        _run_acw_with_context(pl, prompt, copy.deepcopy(arch_context), arch_context_text)
+        for pl, prompt in zip(plan_lines, writer_prompts)
+    ]
+
+
+def _load_arch_context() -> Tuple[Dict[str, Any], str]:
+    """Charge le contexte global (dict brut, texte synthétisé) — best-effort."""
     # Tentative d'injection du contexte global (best-effort)
     try:
         arch_context = load_context_snapshot()
@@ -438,7 +462,16 @@ def run_acw(pl, writer_prompt: str) -> PatchBlock:
         arch_context_text = normalize_context_for_prompt(arch_context)
     except Exception:
         arch_context_text = ""
+    return arch_context, arch_context_text
+
 
+def _run_acw_with_context(
+    pl,
+    writer_prompt: str,
+    arch_context: Dict[str, Any],
+    arch_context_text: str,
+) -> PatchBlock:
+    """Corps de `run_acw` avec un contexte global déjà chargé (partagé en lot)."""
     # Inférence prudente du rôle si absent
     pl_role = getattr(pl, "role", None) or _infer_role_from_pl(pl)
 
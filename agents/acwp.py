@@ -205,6 +205,15 @@ def build_prompt(
     return "\n".join(lines)
 
 
+def build_prompts(plan_lines: Iterable[PlanLine], **kwargs: Any) -> List[str]:
+    """
+    Forme lot de `build_prompt` : un prompt par PlanLine, dans l'ordre.
+
+    Les paramètres nommés (bus_message_id, loop_iteration, …) sont communs au lot.
+    """
+    return [build_prompt(pl, **kwargs) for pl in plan_lines]
+
+
 # ---------------------------- API principale ----------------------------
 
 def build_writer_task(
@@ -359,6 +359,11 @@ def check_module(pb: PatchBlock, *, use_llm: bool = False) -> PatchBlock:
     return pb
 
 
+def check_modules(pbs: List[PatchBlock], *, use_llm: bool = False) -> List[PatchBlock]:
+    """Forme lot de `check_module` : décide chaque PatchBlock, dans l'ordre."""
+    return [check_module(pb, use_llm=use_llm) for pb in pbs]
+
+
 def review_execution_plan(ep_text: str) -> dict:
     """
     Pare-feu réflexif AVANT génération :
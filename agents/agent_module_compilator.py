@@ -2,12 +2,25 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
+from datetime import date, datetime
 import fnmatch
+from functools import partial
 import yaml
 
+try:  # optionnel : sérialisation JSON rapide de l’état PGA
+    import orjson
+except ImportError:  # pragma: no cover - repli stdlib
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # pragma: no cover - PyYAML sans libyaml
+    from yaml import SafeDumper as _Dumper
+
 """
 ===============================================================================
 ARCHCode — agent_module_compilator (PHASE 2 : Agrégation progressive)
@@ -54,6 +67,23 @@ CLI principaux :
   - remove   : supprime un module par nom (recalcule les stats).
   - reset    : initialise un PGA vide (depuis EC + PD).
   - show     : résumé synthétique (statuts, deps, stats, warnings).
+  - compact  : replie le journal d’ajouts (WAL) dans le PGA.
+
+Journal d’ajouts (WAL) :
+  - `add` n’écrit pas le PGA : il ajoute une ligne JSON (= document YAML flow)
+    dans `plan_draft_aggregated.wal.yaml` (append + fsync), soit O(1) par appel.
+  - `show` relit PGA + WAL en mémoire ; `collect`, `remove` et `compact`
+    replient le WAL dans le PGA puis le tronquent ; `reset` l’écarte.
+  - Les lecteurs externes du PGA (ex. agent_plan_validator) refusent un WAL
+    non vide : lancer `compact` (ou `collect`) après une série de `add`.
+
+État interne (sidecar JSON) :
+  - Chaque écriture du PGA produit aussi `plan_draft_aggregated.yaml.json`
+    (orjson si disponible, sinon json stdlib) portant la signature du YAML
+    écrit (mtime_ns, taille) ; les dates YAML y sont étiquetées. Sans forme
+    JSON exacte (clés non-str…), le sidecar est supprimé. Les commandes le
+    relisent si la signature correspond exactement au YAML ; sinon le YAML
+    fait foi (modifié à la main, restauré…). Les lectures n’écrivent jamais.
 
 Compatibilité Mermaid :
   AMC[agent_module_compilator] --> PGA["plan_draft_aggregated.yaml"]
@@ -85,6 +115,146 @@ def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
         yaml.safe_dump(doc, f, sort_keys=False, allow_unicode=True)
 
 
+def _state_json_path(pga_path: Path) -> Path:
+    """Chemin du sidecar JSON de l’état PGA (`plan_draft_aggregated.yaml.json`)."""
+    return pga_path.with_name(pga_path.name + ".json")
+
+
+def _write_bytes_atomic(data: bytes, path: Path) -> None:
+    """Écrit `data` dans un fichier temporaire voisin puis le renomme (os.replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _json_exact(data: Any) -> Optional[bytes]:
+    """
+    Sérialise `data` en JSON si l’aller-retour est exact (types JSON purs), sinon None.
+
+    Dates, clés non-str, ensembles… ne sont pas restitués à l’identique : le
+    document n’a alors pas de représentation JSON fidèle.
+    """
+    try:
+        if orjson is not None:
+            blob = orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            return blob if orjson.loads(blob) == data else None
+        blob = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return blob if json.loads(blob) == data else None
+
+
+def _tag_date(obj: Any) -> Dict[str, str]:
+    """Hook `default` JSON : date/datetime YAML → valeur étiquetée `{"$date": iso}`."""
+    if isinstance(obj, datetime):
+        return {"$datetime": obj.isoformat()}
+    if isinstance(obj, date):
+        return {"$date": obj.isoformat()}
+    raise TypeError(f"type non sérialisable : {type(obj).__name__}")
+
+
+def _revive_dates(obj: Any) -> Any:
+    """Inverse de `_tag_date` : restitue les date/datetime étiquetées."""
+    if isinstance(obj, dict):
+        if len(obj) == 1:
+            ((k, v),) = obj.items()
+            if k == "$date" and isinstance(v, str):
+                return date.fromisoformat(v)
+            if k == "$datetime" and isinstance(v, str):
+                return datetime.fromisoformat(v)
+        return {k: _revive_dates(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_revive_dates(v) for v in obj]
+    return obj
+
+
+def _state_snapshot(doc: Dict[str, Any]) -> Optional[Tuple[bytes, bool]]:
+    """
+    Sérialise le PGA pour le sidecar : (json, dates_étiquetées), ou None si
+    l’aller-retour n’est pas exact (clés non-str, NaN…). Les dates YAML sont
+    étiquetées (`_tag_date`) et restituées à la relecture.
+    """
+    tagged: List[bool] = []
+
+    def hook(obj: Any) -> Dict[str, str]:
+        out = _tag_date(obj)
+        tagged.append(True)
+        return out
+
+    try:
+        if orjson is not None:
+            blob = orjson.dumps(doc, default=hook, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            back = orjson.loads(blob)
+        else:
+            blob = json.dumps(doc, ensure_ascii=False, default=hook).encode("utf-8")
+            back = json.loads(blob)
+    except (TypeError, ValueError):
+        return None
+    if tagged:
+        back = _revive_dates(back)
+    return (blob, bool(tagged)) if back == doc else None
+
+
+def _write_state(doc: Dict[str, Any], out_yaml: Path) -> None:
+    """
+    Écrit le PGA en YAML (lisible) puis son sidecar JSON (relecture rapide).
+
+    Le sidecar enveloppe le document avec la signature du YAML écrit :
+    `{"src": [mtime_ns, taille], "revive": bool, "doc": ...}`. Seules les
+    écritures le produisent ; il est supprimé si le PGA n’a pas de forme JSON exacte.
+    """
+    snap = _state_snapshot(doc)
+    out_yaml.parent.mkdir(parents=True, exist_ok=True)
+    with out_yaml.open("w", encoding="utf-8") as f:
+        yaml.dump(doc, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+    side = _state_json_path(out_yaml)
+    try:
+        if snap is None:
+            side.unlink(missing_ok=True)
+            return
+        blob, revive = snap
+        st = out_yaml.stat()
+        head = f'{{"src":[{st.st_mtime_ns},{st.st_size}],"revive":{"true" if revive else "false"},"doc":'
+        _write_bytes_atomic(head.encode("ascii") + blob + b"}", side)
+    except OSError:
+        pass
+
+
+def _load_state(path: Path) -> Dict[str, Any]:
+    """
+    Charge le PGA depuis le sidecar JSON si sa signature `src` correspond
+    exactement au YAML (mtime_ns et taille), sinon depuis le YAML. Une lecture
+    n’écrit jamais le sidecar.
+    """
+    side = _state_json_path(path)
+    try:
+        raw = side.read_bytes()
+        env = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        st = path.stat()
+        if isinstance(env, dict) and env.get("src") == [st.st_mtime_ns, st.st_size]:
+            doc = env.get("doc")
+            if env.get("revive"):
+                doc = _revive_dates(doc)
+            if isinstance(doc, dict):
+                return doc
+    except (OSError, ValueError):
+        pass
+    return _read_yaml(path)
+
+
+def _pga_root(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Retourne la racine `plan_draft_aggregated` du PGA ; ValueError si absente."""
+    root = doc.get("plan_draft_aggregated")
+    if not isinstance(root, dict):
+        raise ValueError("PGA invalide (clé `plan_draft_aggregated` absente).")
+    return root
+
+
 def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
     """Déduplique une liste de chaînes en préservant l’ordre et en filtrant le vide."""
     if not values:
@@ -122,6 +292,7 @@ def _load_project_draft(pd_path: Path) -> Dict[str, Any]:
 
 def _init_pga_root(*, ec: Dict[str, Any], pd: Dict[str, Any]) -> Dict[str, Any]:
     """Construit une racine plan_draft_aggregated minimale depuis EC + PD."""
+    stamp = _now_iso()
     return {
         "project_name": pd.get("project_name") or "project",
         "bus_message_id": ec.get("bus_message_id"),
@@ -133,8 +304,8 @@ def _init_pga_root(*, ec: Dict[str, Any], pd: Dict[str, Any]) -> Dict[str, Any]:
         "items": [],
         "warnings": [],
         "stats": {"total_items": 0, "validated": 0, "pending": 0, "rejected": 0},
-        "issued_at": _now_iso(),
-        "aggregated_at": _now_iso(),
+        "issued_at": stamp,
+        "aggregated_at": stamp,
     }
 
 
@@ -145,21 +316,22 @@ def _load_or_init_pga(
     pd: Dict[str, Any],
     reset: bool,
     reset_if_missing: bool,
+    wal: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
     Charge le PGA existant, ou l’initialise si reset/reset_if_missing.
-    Rafraîchit spec_version_ref / loop_iteration et complète deps/structure.
+    Rejoue le WAL éventuel (hors reset), puis rafraîchit spec_version_ref /
+    loop_iteration et complète deps/structure.
     """
     if reset or (reset_if_missing and not pga_path.exists()):
         return _init_pga_root(ec=ec, pd=pd)
 
     if pga_path.exists():
-        doc = _read_yaml(pga_path)
-        root = doc.get("plan_draft_aggregated")
-        if not isinstance(root, dict):
-            raise ValueError("PGA invalide (clé `plan_draft_aggregated` absente).")
+        root = _pga_root(_load_state(pga_path))
         if str(root.get("bus_message_id") or "") != str(ec.get("bus_message_id") or ""):
             raise ValueError("bus_message_id PGA ≠ EC.bus_message_id (utilisez --reset).")
+        if wal is not None:
+            _wal_replay(root, wal)
         # rafraîchit les champs volatiles
         root["spec_version_ref"] = ec.get("spec_version")
         root["loop_iteration"] = int(ec.get("loop_iteration") or 0)
@@ -189,6 +361,20 @@ def _extract_module_draft(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return None
 
 
+_MODULE_MARKERS = (b"module_name", b"module_draft")
+_PREFILTER_BYTES = 4096
+
+
+def _yaml_looks_like_module(path: Path) -> bool:
+    """
+    Pré-filtre peu coûteux : lit les premiers Kio et cherche `module_name` /
+    `module_draft` avant tout parsing YAML complet.
+    """
+    with path.open("rb") as f:
+        head = f.read(_PREFILTER_BYTES)
+    return any(m in head for m in _MODULE_MARKERS)
+
+
 def _validate_module_draft(
     md: Dict[str, Any],
     *,
@@ -260,7 +446,14 @@ def _recompute_stats(pga_root: Dict[str, Any]) -> None:
     pga_root["stats"] = stats
 
 
-def _upsert_item(pga_root: Dict[str, Any], *, md: Dict[str, Any], source_path: Path, status: str) -> None:
+def _upsert_item(
+    pga_root: Dict[str, Any],
+    *,
+    md: Dict[str, Any],
+    source_path: Path,
+    status: str,
+    ingested_at: Optional[str] = None,
+) -> None:
     """Ajoute/remplace un item pour `module_name` et met à jour modules/deps/stats."""
     name = str(md.get("module_name") or "").strip()
     if not name:
@@ -269,7 +462,7 @@ def _upsert_item(pga_root: Dict[str, Any], *, md: Dict[str, Any], source_path: P
     new_item = {
         "status": status,
         "source_path": str(source_path.resolve()),
-        "ingested_at": _now_iso(),
+        "ingested_at": ingested_at or _now_iso(),
         "module_draft": md,
     }
     replaced = False
@@ -295,6 +488,102 @@ def _upsert_item(pga_root: Dict[str, Any], *, md: Dict[str, Any], source_path: P
     _bump_stats(pga_root, status)
 
 
+# -----------------------------------------------------------------------------
+# Journal d’ajouts (WAL) du PGA
+# -----------------------------------------------------------------------------
+
+def _wal_path(pga_path: Path) -> Path:
+    """Chemin du WAL associé au PGA (`plan_draft_aggregated.wal.yaml`)."""
+    return pga_path.with_suffix(".wal.yaml")
+
+
+def _wal_append(wal: Path, record: Dict[str, Any]) -> bool:
+    """
+    Ajoute un enregistrement (une ligne JSON) en fin de WAL, avec fsync.
+
+    Retourne False sans rien écrire si l’enregistrement n’a pas de forme JSON
+    exacte (dates, clés non-str…) : l’appelant le replie alors directement.
+    """
+    blob = _json_exact(record)
+    if blob is None:
+        return False
+    wal.parent.mkdir(parents=True, exist_ok=True)
+    with wal.open("ab") as f:
+        f.write(blob + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+    return True
+
+
+def _wal_apply(pga_root: Dict[str, Any], rec: Dict[str, Any]) -> bool:
+    """Applique un enregistrement WAL sur `pga_root` ; False si `op` est inconnu."""
+    for k, v in (rec.get("refresh") or {}).items():
+        pga_root[k] = v
+    for k, v in (rec.get("defaults") or {}).items():
+        if not pga_root.get(k):
+            pga_root[k] = v
+    op = rec.get("op")
+    if op == "upsert":
+        _upsert_item(
+            pga_root,
+            md=rec.get("module") or {},
+            source_path=Path(str(rec.get("source_path") or "")),
+            status=str(rec.get("status") or ""),
+            ingested_at=rec.get("ingested_at"),
+        )
+    elif op == "warn":
+        pga_root.setdefault("warnings", []).append(str(rec.get("message") or ""))
+    else:
+        return False
+    return True
+
+
+def _wal_replay(pga_root: Dict[str, Any], wal: Path) -> int:
+    """
+    Rejoue le WAL en mémoire sur `pga_root` et retourne le nombre d’enregistrements appliqués.
+
+    Enregistrements :
+      - {"op": "upsert", "module": {...}, "source_path", "status", "ingested_at", "refresh", "defaults"}
+      - {"op": "warn", "message": str, "refresh", "defaults"}
+    `refresh` écrase les champs racine ; `defaults` ne complète que les champs vides.
+    Une ligne illisible (append interrompu) est ignorée.
+    """
+    if not wal.exists():
+        return 0
+    applied = 0
+    for line in wal.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if _wal_apply(pga_root, rec):
+            applied += 1
+    return applied
+
+
+def _wal_record(pga_yaml: Path, wal: Path, record: Dict[str, Any]) -> None:
+    """
+    Journalise `record` dans le WAL ; à défaut de forme JSON exacte, replie
+    WAL + enregistrement directement dans le PGA (chemin lent, sans perte).
+    """
+    if _wal_append(wal, record):
+        return
+    doc = _load_state(pga_yaml)
+    root = _pga_root(doc)
+    _wal_replay(root, wal)
+    _wal_apply(root, record)
+    _write_state(doc, pga_yaml)
+    _wal_truncate(wal)
+
+
+def _wal_truncate(wal: Path) -> None:
+    """Supprime le WAL une fois replié dans le PGA (ou devenu obsolète)."""
+    wal.unlink(missing_ok=True)
+
+
 # -----------------------------------------------------------------------------
 # Scan récursif des drafts
 # -----------------------------------------------------------------------------
@@ -334,11 +623,12 @@ def _find_module_drafts(roots: List[Path], patterns: Optional[List[str]] = None)
 # -----------------------------------------------------------------------------
 
 def cmd_reset(ec_yaml: Path, pd_yaml: Path, out: Path) -> None:
-    """Initialise un PGA vide depuis EC + PD."""
+    """Initialise un PGA vide depuis EC + PD (le WAL éventuel est écarté)."""
     ec = _load_ec(ec_yaml)
     pd = _load_project_draft(pd_yaml)
     root = _init_pga_root(ec=ec, pd=pd)
-    _write_yaml({"plan_draft_aggregated": root}, out)
+    _write_state({"plan_draft_aggregated": root}, out)
+    _wal_truncate(_wal_path(out))
     print(f"[OK] plan_draft_aggregated initialisé → {out}")
 
 
@@ -351,43 +641,56 @@ def cmd_add(
     accept_untagged: bool,
     allow_non_ok: bool,
 ) -> None:
-    """Ajoute (upsert) un module_draft unique dans un PGA existant."""
+    """
+    Ajoute (upsert) un module_draft unique dans un PGA existant.
+
+    Le PGA n’est pas réécrit : l’upsert (ou le warning) est ajouté au WAL,
+    replié plus tard par `collect`/`remove`/`compact` (qui contrôlent alors la
+    racine `plan_draft_aggregated`). Les lecteurs du PGA (agent_plan_validator)
+    refusent un WAL non replié.
+    """
     if not pga_yaml.exists():
         raise FileNotFoundError(f"{pga_yaml} introuvable. Lancez `reset` ou `collect --reset-if-missing`.")
-    doc_pga = _read_yaml(pga_yaml)
-    pga_root = doc_pga.get("plan_draft_aggregated")
-    if not isinstance(pga_root, dict):
-        raise ValueError("PGA invalide (clé `plan_draft_aggregated` absente).")
+    wal = _wal_path(pga_yaml)
 
-    # cohérence EC (et rafraîchit quelques champs)
+    # cohérence EC (et rafraîchit quelques champs au prochain repli)
     ec = _load_ec(ec_yaml)
     pd = _load_project_draft(pd_yaml)
-    pga_root["spec_version_ref"] = ec.get("spec_version")
-    pga_root["loop_iteration"] = int(ec.get("loop_iteration") or 0)
-    if not pga_root.get("project_name"):
-        pga_root["project_name"] = pd.get("project_name") or pga_root.get("project_name") or "project"
-    if pd and not pga_root.get("folder_structure"):
-        pga_root["folder_structure"] = pd.get("folder_structure") or {}
+    refresh: Dict[str, Any] = {
+        "spec_version_ref": ec.get("spec_version"),
+        "loop_iteration": int(ec.get("loop_iteration") or 0),
+    }
+    defaults: Dict[str, Any] = {"project_name": pd.get("project_name") or "project"}
+    if pd:
+        defaults["folder_structure"] = pd.get("folder_structure") or {}
 
     # lecture du module
     doc = _read_yaml(module_yaml)
     md = _extract_module_draft(doc)
     if not md:
-        pga_root.setdefault("warnings", []).append(f"IGNORED {module_yaml}: pas de module_draft")
-        _write_yaml({"plan_draft_aggregated": pga_root}, pga_yaml)
+        _wal_record(pga_yaml, wal, {"op": "warn", "message": f"IGNORED {module_yaml}: pas de module_draft",
+                                     "refresh": refresh, "defaults": defaults})
         print(f"[WARN] {module_yaml} ignoré (pas de module_draft)")
         return
 
     ok, reason = _validate_module_draft(md, allow_non_ok=allow_non_ok, accept_untagged=accept_untagged)
     if not ok:
-        pga_root.setdefault("warnings", []).append(f"IGNORED {module_yaml}: {reason}")
-        _write_yaml({"plan_draft_aggregated": pga_root}, pga_yaml)
+        _wal_record(pga_yaml, wal, {"op": "warn", "message": f"IGNORED {module_yaml}: {reason}",
+                                     "refresh": refresh, "defaults": defaults})
         print(f"[WARN] {module_yaml} ignoré ({reason})")
         return
 
-    _upsert_item(pga_root, md=md, source_path=module_yaml, status=(md.get("validator_status") or reason))
-    pga_root["aggregated_at"] = _now_iso()
-    _write_yaml({"plan_draft_aggregated": pga_root}, pga_yaml)
+    now = _now_iso()
+    refresh["aggregated_at"] = now
+    _wal_record(pga_yaml, wal, {
+        "op": "upsert",
+        "module": md,
+        "source_path": str(module_yaml.resolve()),
+        "status": md.get("validator_status") or reason,
+        "ingested_at": now,
+        "refresh": refresh,
+        "defaults": defaults,
+    })
     print(f"[OK] Ajouté : {module_yaml}")
 
 
@@ -406,42 +709,55 @@ def cmd_collect(
 ) -> None:
     """
     Scanne récursivement des module_draft.yaml, applique la politique d’inclusion,
-    agrège (upsert) et persiste le plan_draft_aggregated.yaml.
+    agrège (upsert) et persiste le plan_draft_aggregated.yaml (WAL replié).
     """
     ec = _load_ec(ec_yaml)
     pd = _load_project_draft(pd_yaml)
-    pga_root = _load_or_init_pga(out, ec=ec, pd=pd, reset=reset, reset_if_missing=reset_if_missing)
+    wal = _wal_path(out)
+    pga_root = _load_or_init_pga(out, ec=ec, pd=pd, reset=reset, reset_if_missing=reset_if_missing, wal=wal)
 
     files = _find_module_drafts(roots, patterns)
     if not files:
         print("[INFO] Aucun module_draft.yaml trouvé (scan terminé).")
 
+    # Liaisons locales (LOAD_FAST) pour la boucle de scan
+    warnings_append = pga_root.setdefault("warnings", []).append
+    looks_like_module = _yaml_looks_like_module
+    read = _read_yaml
+    extract = _extract_module_draft
+    validate = partial(_validate_module_draft, allow_non_ok=allow_non_ok, accept_untagged=accept_untagged)
+    upsert = partial(_upsert_item, pga_root)
+    yaml_error = yaml.YAMLError
+
     added = 0
     skipped = 0
     for f in files:
+        # fichiers sans marqueur de module : simples correspondances de motif, ignorés sans warning
+        if not looks_like_module(f):
+            continue
         try:
-            doc = _read_yaml(f)
-            md = _extract_module_draft(doc)
+            md = extract(read(f))
             if not md:
-                pga_root.setdefault("warnings", []).append(f"IGNORED {f}: pas de module_draft")
+                warnings_append(f"IGNORED {f}: pas de module_draft")
                 skipped += 1
                 continue
 
-            ok, reason = _validate_module_draft(md, allow_non_ok=allow_non_ok, accept_untagged=accept_untagged)
+            ok, reason = validate(md)
             if not ok:
-                pga_root.setdefault("warnings", []).append(f"IGNORED {f}: {reason}")
+                warnings_append(f"IGNORED {f}: {reason}")
                 skipped += 1
                 continue
 
-            _upsert_item(pga_root, md=md, source_path=f, status=(md.get("validator_status") or reason))
+            upsert(md=md, source_path=f, status=(md.get("validator_status") or reason))
             added += 1
-        except yaml.YAMLError as e:
-            pga_root.setdefault("warnings", []).append(f"IGNORED {f}: YAML invalide ({e})")
+        except yaml_error as e:
+            warnings_append(f"IGNORED {f}: YAML invalide ({e})")
             skipped += 1
 
     # Persister PGA
     pga_root["aggregated_at"] = _now_iso()
-    _write_yaml({"plan_draft_aggregated": pga_root}, out)
+    _write_state({"plan_draft_aggregated": pga_root}, out)
+    _wal_truncate(wal)
     print(f"[OK] Agrégation terminée : {added} ajouté(s), {skipped} ignoré(s). → {out}")
 
     # Option : mise à jour EC.modules
@@ -461,8 +777,9 @@ def cmd_remove(
     _ = _load_ec(ec_yaml)  # contrôle min
     if not out.exists():
         raise FileNotFoundError(f"PGA introuvable : {out}")
-    doc = _read_yaml(out)
-    root = doc.get("plan_draft_aggregated") or {}
+    wal = _wal_path(out)
+    root = _pga_root(_load_state(out))
+    _wal_replay(root, wal)
     items = root.get("items") or []
     keep: List[Dict[str, Any]] = []
     removed = False
@@ -476,29 +793,37 @@ def cmd_remove(
     root["items"] = keep
     root["modules"] = [m for m in (root.get("modules") or []) if m != module_name]
     _recompute_stats(root)
-    _write_yaml({"plan_draft_aggregated": root}, out)
+    _write_state({"plan_draft_aggregated": root}, out)
+    _wal_truncate(wal)
     if removed:
         print(f"[OK] Module '{module_name}' retiré du PGA.")
     else:
         print(f"[INFO] Aucun module '{module_name}' à retirer.")
 
 
+def cmd_compact(out: Path) -> None:
+    """Replie le WAL dans le PGA puis le tronque (no-op si le WAL est vide)."""
+    if not out.exists():
+        raise FileNotFoundError(f"PGA introuvable : {out}")
+    wal = _wal_path(out)
+    root = _pga_root(_load_state(out))
+    applied = _wal_replay(root, wal)
+    if applied:
+        _write_state({"plan_draft_aggregated": root}, out)
+    _wal_truncate(wal)
+    print(f"[OK] Compaction terminée : {applied} enregistrement(s) replié(s). → {out}")
+
+
 def cmd_show(out: Path) -> None:
     """Affiche un résumé synthétique du PGA (modules, deps, stats, warnings)."""
     if not out.exists():
         print("[INFO] Aucun plan_draft_aggregated.yaml n'existe encore.")
         return
-    doc = _read_yaml(out)
+    doc = _load_state(out)
     root = doc.get("plan_draft_aggregated") or {}
+    _wal_replay(root, _wal_path(out))
     mods: List[str] = list(root.get("modules") or [])
     items: List[Dict[str, Any]] = list(root.get("items") or [])
-    statuses: Dict[str, str] = {}
-    for it in items:
-        md = (it or {}).get("module_draft") or {}
-        name = str(md.get("module_name") or "").strip()
-        st = str(it.get("status") or "").strip()
-        if name:
-            statuses[name] = st or "∅"
     deps = ", ".join(root.get("dependencies") or []) or "∅"
     warns = root.get("warnings") or []
     stats = root.get("stats") or {}
@@ -517,9 +842,19 @@ def cmd_show(out: Path) -> None:
         f"aggregated_at    : {root.get('aggregated_at')}",
     ]))
     if items:
+        # une passe, tri par nom : sortie déterministe
+        rows = sorted(
+            (
+                (str(((it or {}).get("module_draft") or {}).get("module_name") or "").strip(),
+                 str((it or {}).get("status") or "").strip() or "∅")
+                for it in items
+            ),
+            key=lambda r: r[0],
+        )
         print("— Statuts modules —")
-        for m in mods:
-            print(f"  - {m:12s} : {statuses.get(m, '∅')}")
+        for name, st in rows:
+            if name:
+                print(f"  - {name:12s} : {st}")
 
 def collect_modules(
     *,
@@ -559,7 +894,7 @@ def collect_modules(
 # -----------------------------------------------------------------------------
 
 def _build_parser() -> argparse.ArgumentParser:
-    """Construit le parseur CLI pour collect/add/remove/reset/show."""
+    """Construit le parseur CLI pour collect/add/remove/reset/show/compact."""
     p = argparse.ArgumentParser(
         prog="agent_module_compilator",
         description="ARCHCode — Agrège des module_draft.yaml → plan_draft_aggregated.yaml (déterministe).",
@@ -611,11 +946,15 @@ def _build_parser() -> argparse.ArgumentParser:
     sp_show = sub.add_parser("show", help="Afficher un résumé du PGA")
     sp_show.add_argument("--out", type=Path, default=Path(".archcode") / "plan_draft_aggregated.yaml", help="Chemin du PGA")
 
+    # compact
+    sp_compact = sub.add_parser("compact", help="Replier le WAL des `add` dans le PGA")
+    sp_compact.add_argument("--out", type=Path, default=Path(".archcode") / "plan_draft_aggregated.yaml", help="Chemin du PGA")
+
     return p
 
 
 def main(argv: Optional[List[str]] = None) -> None:
-    """Point d’entrée CLI de l’agent : collect/add/remove/reset/show."""
+    """Point d’entrée CLI de l’agent : collect/add/remove/reset/show/compact."""
     parser = _build_parser()
     args = parser.parse_args(argv)
 
@@ -652,6 +991,8 @@ def main(argv: Optional[List[str]] = None) -> None:
             cmd_reset(ec_yaml=args.ec, pd_yaml=args.pd, out=args.out)
         elif args.cmd == "show":
             cmd_show(out=args.out)
+        elif args.cmd == "compact":
+            cmd_compact(out=args.out)
         else:
             parser.print_help()
             raise SystemExit(1)
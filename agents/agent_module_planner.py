@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import re
-import yaml
 
 """
 ===============================================================================
@@ -43,6 +47,11 @@ Contraintes MVP :
   - Respect des conventions utilisées par `agent_module_compilator` et
     `execution_plan_transformer` (liste `files_expected[]` minimale, nom module).
 
+Caches (régénérables, ignorés par Git) :
+  - `<ec|pd>.yaml.json` : EC/PD déjà parsés (signature mtime_ns + taille, JSON exact).
+  - `.archcode/.cache/module_draft/<clé>/<module>.yaml` : drafts mémoïsés par
+    `plan-all`, clé = hash(EC, PD, source de l'agent).
+
 CLI :
   - Planifier un module :
       python -m agents.agent_module_planner plan auth
@@ -60,6 +69,33 @@ Auteur : Alex
 # Utilitaires généraux
 # -----------------------------------------------------------------------------
 
+# PyYAML est importé à la première utilisation : `--help` et les erreurs
+# d'arguments n'en paient pas le coût.
+_yaml: Any = None
+_Loader: Any = None
+_Dumper: Any = None
+_BaseLoader: Any = None
+
+
+def _get_yaml() -> Any:
+    """Importe PyYAML (et ses classes C si libyaml est présent) à la demande.
+
+    Retour
+    ------
+    module
+        Le module `yaml` ; `_Loader`/`_Dumper`/`_BaseLoader` sont renseignés.
+    """
+    global _yaml, _Loader, _Dumper, _BaseLoader
+    if _yaml is None:
+        import yaml
+        try:  # libyaml (C) si disponible, sinon implémentations pure-Python
+            from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper, CBaseLoader as _BaseLoader
+        except ImportError:  # pragma: no cover - PyYAML sans libyaml
+            from yaml import SafeLoader as _Loader, SafeDumper as _Dumper, BaseLoader as _BaseLoader
+        _yaml = yaml
+    return _yaml
+
+
 def _now_iso() -> str:
     """Retourne un horodatage ISO-8601 à la seconde.
 
@@ -91,12 +127,277 @@ def _read_yaml(path: Path) -> Dict[str, Any]:
     yaml.YAMLError
         Si le contenu YAML est invalide.
     """
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = _get_yaml().load(path.read_bytes(), Loader=_Loader)
     return data or {}
 
 
-def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
-    """Écrit un dictionnaire dans un fichier YAML (création des dossiers incluse).
+def _read_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Charge un YAML via un cache JSON voisin (`<fichier>.yaml.json`).
+
+    Même miroir et même format que `agent_project_planner` :
+    `{"src": [mtime_ns, taille], "doc": ...}`. Le cache n'est relu que si sa
+    signature correspond exactement au YAML ; sinon le YAML est re-parsé et le
+    cache réécrit de façon atomique, uniquement si l'aller-retour JSON est
+    exact (sinon il est supprimé : dates, clés non-str…). Un dossier en
+    lecture seule désactive simplement le cache.
+
+    Paramètres
+    ----------
+    path : Path
+        Chemin du fichier YAML source.
+
+    Retour
+    ------
+    Dict[str, Any]
+        Dictionnaire résultant ; {} si le document est vide.
+    """
+    cache = path.with_name(path.name + ".json")
+    st = path.stat()
+    try:
+        env = json.loads(cache.read_bytes())
+        if isinstance(env, dict) and env.get("src") == [st.st_mtime_ns, st.st_size]:
+            data = env.get("doc")
+            if isinstance(data, dict):
+                return data
+    except (OSError, ValueError):
+        pass
+    data = _read_yaml(path)
+    try:
+        blob = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        exact = json.loads(blob) == data
+    except (TypeError, ValueError):
+        exact = False
+    try:
+        if exact:
+            head = f'{{"src":[{st.st_mtime_ns},{st.st_size}],"doc":'.encode("ascii")
+            _write_bytes(head + blob + b"}", cache)
+        else:
+            cache.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return data
+
+
+# Scalaire YAML émis tel quel (plain) : commence par une lettre/underscore,
+# sans `:`/`#`/guillemet initial ; sinon chaîne JSON (= YAML double-quoted).
+_PLAIN_SCALAR = re.compile(r"[^\W\d][\w .,/()'+-]*")
+_YAML_RESERVED = frozenset({"true", "false", "yes", "no", "on", "off", "null", "y", "n"})
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Sérialise un scalaire du schéma module_draft en YAML (quote seulement si besoin).
+
+    Paramètres
+    ----------
+    value : Any
+        None, bool, int ou str.
+
+    Retour
+    ------
+    str
+        Représentation YAML du scalaire.
+
+    Exceptions
+    ----------
+    ValueError
+        Type hors schéma ou chaîne non imprimable (→ repli PyYAML).
+    """
+    if value is None:
+        return "null"
+    if value is True or value is False:
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, str):
+        if (
+            _PLAIN_SCALAR.fullmatch(value)
+            and value[-1] != " "
+            and value.lower() not in _YAML_RESERVED
+        ):
+            return value
+        if not value.isprintable():
+            raise ValueError("chaîne non imprimable")
+        return json.dumps(value, ensure_ascii=False)
+    raise ValueError(f"type hors schéma : {type(value).__name__}")
+
+
+def _emit_block(obj: Dict[str, Any], indent: int, out: List[str]) -> None:
+    """Émet un mapping en style bloc (listes non indentées, comme PyYAML).
+
+    Paramètres
+    ----------
+    obj : Dict[str, Any]
+        Mapping à émettre (clés str ; valeurs scalaires, listes de scalaires ou mappings).
+    indent : int
+        Indentation courante (espaces).
+    out : List[str]
+        Lignes produites (modifiée en place).
+
+    Retour
+    ------
+    None
+
+    Exceptions
+    ----------
+    ValueError
+        Structure hors schéma (→ repli PyYAML).
+    """
+    pad = " " * indent
+    for k, v in obj.items():
+        if not isinstance(k, str):
+            raise ValueError("clé non textuelle")
+        key = _yaml_scalar(k)
+        if isinstance(v, dict):
+            if not v:
+                out.append(f"{pad}{key}: {{}}")
+            else:
+                out.append(f"{pad}{key}:")
+                _emit_block(v, indent + 2, out)
+        elif isinstance(v, list):
+            if not v:
+                out.append(f"{pad}{key}: []")
+            else:
+                out.append(f"{pad}{key}:")
+                for item in v:
+                    if isinstance(item, (dict, list)):
+                        raise ValueError("liste imbriquée hors schéma")
+                    out.append(f"{pad}- {_yaml_scalar(item)}")
+        else:
+            out.append(f"{pad}{key}: {_yaml_scalar(v)}")
+
+
+def _emit_module_draft_yaml(doc: Dict[str, Any]) -> Optional[str]:
+    """Émission YAML directe pour le schéma fixe `module_draft` (sans PyYAML).
+
+    Paramètres
+    ----------
+    doc : Dict[str, Any]
+        Document `{"module_draft": {...}}`.
+
+    Retour
+    ------
+    Optional[str]
+        Texte YAML, ou None si le document sort du schéma (l'appelant
+        se rabat alors sur `yaml.dump`).
+    """
+    out: List[str] = []
+    try:
+        _emit_block(doc, 0, out)
+    except ValueError:
+        return None
+    return "\n".join(out) + "\n"
+
+
+_O_BINARY = getattr(os, "O_BINARY", 0)  # Windows : pas de traduction des fins de ligne
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Écrit intégralement `data` sur un descripteur (gère les écritures partielles).
+
+    Paramètres
+    ----------
+    fd : int
+        Descripteur ouvert en écriture.
+    data : bytes
+        Contenu à écrire.
+
+    Retour
+    ------
+    None
+    """
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+
+def _open_for_write(path: Path, flags: int) -> int:
+    """Ouvre `path` en écriture ; crée le dossier parent seulement si absent (ENOENT).
+
+    Paramètres
+    ----------
+    path : Path | str
+        Fichier à ouvrir.
+    flags : int
+        Drapeaux `os.open` additionnels (O_TRUNC, O_EXCL...).
+
+    Retour
+    ------
+    int
+        Descripteur de fichier.
+    """
+    flags |= os.O_WRONLY | os.O_CREAT | _O_BINARY
+    try:
+        return os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, flags, 0o644)
+
+
+def _write_bytes(data: bytes, path: Path, *, exclusive: bool = False) -> None:
+    """Écrit des octets sur disque en un seul appel.
+
+    - exclusive=False : fichier temporaire voisin + `os.replace` (atomique, écrase).
+    - exclusive=True  : création directe en O_EXCL ; lève FileExistsError si
+      la cible existe déjà (contrôle + création en un seul appel système).
+
+    Paramètres
+    ----------
+    data : bytes
+        Contenu à écrire.
+    path : Path
+        Destination.
+    exclusive : bool
+        Refuser d'écraser un fichier existant.
+
+    Retour
+    ------
+    None
+
+    Exceptions
+    ----------
+    FileExistsError
+        Si `exclusive` et que `path` existe déjà.
+    """
+    target = f"{path}.tmp.{os.getpid()}" if not exclusive else str(path)
+    fd = _open_for_write(target, os.O_EXCL if exclusive else os.O_TRUNC)
+    try:
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        if not exclusive:
+            os.replace(target, path)
+    except BaseException:
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        raise
+
+
+def _dump_yaml_bytes(doc: Dict[str, Any]) -> bytes:
+    """Sérialise un document en YAML UTF-8 (émetteur direct, sinon PyYAML).
+
+    Paramètres
+    ----------
+    doc : Dict[str, Any]
+        Données à sérialiser.
+
+    Retour
+    ------
+    bytes
+        Texte YAML encodé en UTF-8.
+    """
+    text = _emit_module_draft_yaml(doc)
+    if text is None:
+        text = _get_yaml().dump(doc, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+    return text.encode("utf-8")
+
+
+def _write_yaml(doc: Dict[str, Any], path: Path, *, exclusive: bool = False) -> None:
+    """Écrit un dictionnaire dans un fichier YAML, de façon atomique (tmp + os.replace).
 
     Paramètres
     ----------
@@ -104,14 +405,14 @@ def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
         Données à sérialiser.
     path : Path
         Destination du fichier YAML.
+    exclusive : bool
+        Création exclusive (O_EXCL) : FileExistsError si le fichier existe.
 
     Retour
     ------
     None
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(doc, f, sort_keys=False, allow_unicode=True)
+    _write_bytes(_dump_yaml_bytes(doc), path, exclusive=exclusive)
 
 
 def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
@@ -129,13 +430,8 @@ def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
     """
     if not values:
         return []
-    out, seen = [], set()
-    for v in values:
-        s = str(v).strip()
-        if s and s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+    # dict.fromkeys : déduplication ordonnée en C
+    return list(dict.fromkeys(s for v in values if (s := str(v).strip())))
 
 
 # -----------------------------------------------------------------------------
@@ -160,7 +456,7 @@ def _load_ec(path: Path) -> Dict[str, Any]:
     ValueError
         Si `bus_message_id` est manquant.
     """
-    ec = _read_yaml(path)
+    ec = _read_yaml_cached(path)
     if not ec.get("bus_message_id"):
         raise ValueError("ExecutionContext : champ `bus_message_id` manquant.")
     return ec
@@ -181,7 +477,7 @@ def _load_pd(path: Path) -> Dict[str, Any]:
     """
     if not path.exists():
         return {}
-    doc = _read_yaml(path)
+    doc = _read_yaml_cached(path)
     return doc.get("project_draft") or {}
 
 
@@ -189,6 +485,10 @@ def _load_pd(path: Path) -> Dict[str, Any]:
 # Heuristiques déterministes : priorités, dépendances, phase
 # -----------------------------------------------------------------------------
 
+# Arête de dépendance "a → b" / "a -> b" / "a => b" (espaces absorbés)
+_DEP_SPLIT = re.compile(r"\s*(?:→|->|=>)\s*")
+
+
 def _priority_for_module(pd: Dict[str, Any], module_name: str) -> Optional[str]:
     """Retourne la priorité d’un module en s’appuyant sur `project_draft.priority_map`.
 
@@ -227,16 +527,30 @@ def _dependencies_for_module(pd: Dict[str, Any], module_name: str) -> List[str]:
     depends: List[str] = []
     for expr in deps_spec:
         # Exemples attendus : "api → core", "tests → core"
-        parts = re.split(r"→|->|=>", str(expr))
+        expr = str(expr).strip()
+        if module_name not in expr:
+            continue
+        parts = _DEP_SPLIT.split(expr)
         if len(parts) != 2:
             continue
-        a = parts[0].strip()
-        b = parts[1].strip()
+        a, b = parts
         if a == module_name and b:
             depends.append(b)
     return _dedup_str_list(depends)
 
 
+_PHASE_MAP: Dict[str, str] = {
+    "auth": "authentification",
+    "api": "interface_api",
+    "core": "coeur_metier",
+    "ui_layer": "interface_utilisateur",
+    "utils": "transverse",
+    "billing": "gestion_facturation",
+    "reports": "reporting",
+    "tests": "tests",
+}
+
+
 def _phase_for_module(module_name: str) -> Optional[str]:
     """Retourne une étiquette de phase pour un module (informatif).
 
@@ -250,30 +564,59 @@ def _phase_for_module(module_name: str) -> Optional[str]:
     Optional[str]
         Phase textuelle (ex. 'authentification', 'api', 'cœur', 'tests', ...).
     """
-    mapping = {
-        "auth": "authentification",
-        "api": "interface_api",
-        "core": "coeur_metier",
-        "ui_layer": "interface_utilisateur",
-        "utils": "transverse",
-        "billing": "gestion_facturation",
-        "reports": "reporting",
-        "tests": "tests",
-    }
-    return mapping.get(module_name)
+    return _PHASE_MAP.get(module_name)
 
 
 # -----------------------------------------------------------------------------
 # Heuristiques : responsibilities, files_expected, entrypoint, I/O
 # -----------------------------------------------------------------------------
 
-def _responsibilities_for_module(ec: Dict[str, Any], module_name: str) -> List[str]:
+_RESPONSIBILITIES_MAP: Dict[str, Tuple[str, ...]] = {
+    "core": (
+        "Modéliser les entités métier",
+        "Exposer les services métier (sans I/O réseau)",
+        "Garantir l'intégrité des règles de gestion",
+    ),
+    "api": (
+        "Exposer des endpoints REST/HTTP",
+        "Valider les payloads d'entrée",
+        "Mapper les erreurs métier en statuts HTTP",
+    ),
+    "auth": (
+        "Gérer l'identité et l'authentification",
+        "Émettre et vérifier les tokens",
+        "Gérer les permissions d'accès",
+    ),
+    "ui_layer": (
+        "Offrir une interface CLI/Web pour les actions clés",
+        "Orchestrer les interactions utilisateur",
+    ),
+    "utils": (
+        "Fournir des helpers transverses",
+        "Factoriser la logique utilitaire",
+    ),
+    "billing": (
+        "Gérer les factures et paiements",
+        "Calculer les montants et taxes",
+    ),
+    "reports": (
+        "Générer des rapports et exports",
+        "Assembler des données issues des services",
+    ),
+    "tests": (
+        "Couvrir les fonctionnalités critiques",
+        "Valider les contrats d'API",
+    ),
+}
+
+
+def _responsibilities_for_module(text: str, module_name: str) -> List[str]:
     """Génère une liste de responsabilités typiques par module, avec coloration EC.
 
     Paramètres
     ----------
-    ec : Dict[str, Any]
-        ExecutionContext (objectifs, stories, contraintes...).
+    text : str
+        Objectifs + stories de l'EC, joints et en minuscules (cf. `_build_text_index`).
     module_name : str
         Nom du module.
 
@@ -282,51 +625,9 @@ def _responsibilities_for_module(ec: Dict[str, Any], module_name: str) -> List[s
     List[str]
         Liste de responsabilités suggérées (déterministe).
     """
-    base: Dict[str, List[str]] = {
-        "core": [
-            "Modéliser les entités métier",
-            "Exposer les services métier (sans I/O réseau)",
-            "Garantir l'intégrité des règles de gestion",
-        ],
-        "api": [
-            "Exposer des endpoints REST/HTTP",
-            "Valider les payloads d'entrée",
-            "Mapper les erreurs métier en statuts HTTP",
-        ],
-        "auth": [
-            "Gérer l'identité et l'authentification",
-            "Émettre et vérifier les tokens",
-            "Gérer les permissions d'accès",
-        ],
-        "ui_layer": [
-            "Offrir une interface CLI/Web pour les actions clés",
-            "Orchestrer les interactions utilisateur",
-        ],
-        "utils": [
-            "Fournir des helpers transverses",
-            "Factoriser la logique utilitaire",
-        ],
-        "billing": [
-            "Gérer les factures et paiements",
-            "Calculer les montants et taxes",
-        ],
-        "reports": [
-            "Générer des rapports et exports",
-            "Assembler des données issues des services",
-        ],
-        "tests": [
-            "Couvrir les fonctionnalités critiques",
-            "Valider les contrats d'API",
-        ],
-    }
-    out = list(base.get(module_name, []))
+    out = list(_RESPONSIBILITIES_MAP.get(module_name, ()))
 
     # Coloration par mots-clés depuis objectives & stories
-    text = " ".join([
-        " ".join(ec.get("functional_objectives") or []),
-        " ".join([us.get("story", "") for us in (ec.get("user_stories") or [])]),
-    ]).lower()
-
     def add_if(keyword: str, resp: str) -> None:
         if keyword in text and resp not in out:
             out.append(resp)
@@ -345,6 +646,18 @@ def _responsibilities_for_module(ec: Dict[str, Any], module_name: str) -> List[s
     return out
 
 
+_FILES_MAP: Dict[str, Tuple[str, ...]] = {
+    "core": ("__init__.py", "models.py", "services.py"),
+    "api": ("__init__.py", "routes.py", "handlers.py", "schemas.py"),
+    "auth": ("__init__.py", "models.py", "service.py", "routes.py", "tokens.py"),
+    "ui_layer": ("__init__.py", "cli.py", "views.py"),
+    "utils": ("__init__.py", "helpers.py"),
+    "billing": ("__init__.py", "models.py", "service.py", "invoices.py"),
+    "reports": ("__init__.py", "report_generator.py", "pdf.py"),
+}
+_TESTS_FILES_BASE: Tuple[str, ...] = ("test_core.py",)
+
+
 def _files_for_module(module_name: str, present_modules: List[str]) -> List[str]:
     """Propose une liste déterministe de fichiers attendus par module.
 
@@ -360,31 +673,32 @@ def _files_for_module(module_name: str, present_modules: List[str]) -> List[str]
     List[str]
         Liste `files_expected[]` (chemins relatifs à la racine du module).
     """
-    if module_name == "core":
-        return ["__init__.py", "models.py", "services.py"]
-    if module_name == "api":
-        return ["__init__.py", "routes.py", "handlers.py", "schemas.py"]
-    if module_name == "auth":
-        return ["__init__.py", "models.py", "service.py", "routes.py", "tokens.py"]
-    if module_name == "ui_layer":
-        return ["__init__.py", "cli.py", "views.py"]
-    if module_name == "utils":
-        return ["__init__.py", "helpers.py"]
-    if module_name == "billing":
-        return ["__init__.py", "models.py", "service.py", "invoices.py"]
-    if module_name == "reports":
-        return ["__init__.py", "report_generator.py", "pdf.py"]
     if module_name == "tests":
-        base = ["test_core.py"]
+        base = list(_TESTS_FILES_BASE)
         if "api" in present_modules:
             base.append("test_api.py")
         if "auth" in present_modules:
             base.append("test_auth.py")
         return base
+    files = _FILES_MAP.get(module_name)
+    if files is not None:
+        return list(files)
     # Fallback
     return ["__init__.py", f"{module_name}.py"]
 
 
+_ENTRYPOINT_MAP: Dict[str, Optional[str]] = {
+    "api": "routes.py",
+    "ui_layer": "cli.py:main",
+    "auth": "service.py",
+    "core": "services.py",
+    "reports": "report_generator.py",
+    "billing": "service.py",
+    "utils": None,
+    "tests": None,
+}
+
+
 def _entrypoint_for_module(module_name: str) -> Optional[str]:
     """Suggère un entrypoint (indicatif) pour le module.
 
@@ -398,26 +712,16 @@ def _entrypoint_for_module(module_name: str) -> Optional[str]:
     Optional[str]
         Chemin/fonction ou nom de fichier principal, sinon None.
     """
-    mapping = {
-        "api": "routes.py",
-        "ui_layer": "cli.py:main",
-        "auth": "service.py",
-        "core": "services.py",
-        "reports": "report_generator.py",
-        "billing": "service.py",
-        "utils": None,
-        "tests": None,
-    }
-    return mapping.get(module_name)
+    return _ENTRYPOINT_MAP.get(module_name)
 
 
-def _inputs_outputs_for_module(ec: Dict[str, Any], module_name: str) -> Tuple[List[str], List[str]]:
-    """Déduit des entrées/sorties génériques pour un module à partir de l'EC.
+def _inputs_outputs_for_module(ec_ctx: Dict[str, Any], module_name: str) -> Tuple[List[str], List[str]]:
+    """Déduit des entrées/sorties génériques pour un module à partir du contexte EC.
 
     Paramètres
     ----------
-    ec : Dict[str, Any]
-        ExecutionContext (sources/targets).
+    ec_ctx : Dict[str, Any]
+        Contexte EC pré-calculé (cf. `_build_ec_ctx`, clés `ec_inputs`/`ec_outputs`).
     module_name : str
         Nom du module.
 
@@ -426,8 +730,8 @@ def _inputs_outputs_for_module(ec: Dict[str, Any], module_name: str) -> Tuple[Li
     Tuple[List[str], List[str]]
         (inputs[], outputs[]) déterministes.
     """
-    inputs = _dedup_str_list(ec.get("input_sources") or [])
-    outputs = _dedup_str_list(ec.get("output_targets") or [])
+    inputs = list(ec_ctx["ec_inputs"])
+    outputs = list(ec_ctx["ec_outputs"])
     # Spécialisation légère selon module
     if module_name == "api":
         inputs = _dedup_str_list(inputs + ["HTTP request"])
@@ -440,33 +744,76 @@ def _inputs_outputs_for_module(ec: Dict[str, Any], module_name: str) -> Tuple[Li
     return inputs, outputs
 
 
-def _technical_constraints(ec: Dict[str, Any]) -> List[str]:
+def _technical_constraints(ec: Dict[str, Any], nfc: Optional[List[str]] = None) -> List[str]:
     """Récupère les contraintes techniques/non-fonctionnelles utiles au draft.
 
     Paramètres
     ----------
     ec : Dict[str, Any]
         ExecutionContext (non_functional_constraints, deployment_context...).
+    nfc : Optional[List[str]]
+        `non_functional_constraints` déjà dédupliquées (recalculées si None).
 
     Retour
     ------
     List[str]
         Contraintes (liste dédupliquée).
     """
-    nfc = _dedup_str_list(ec.get("non_functional_constraints") or [])
+    if nfc is None:
+        nfc = _dedup_str_list(ec.get("non_functional_constraints") or [])
     ctx = str(ec.get("deployment_context") or "").strip()
-    if ctx:
-        nfc.append(f"deployment:{ctx}")
-    return _dedup_str_list(nfc)
+    return _dedup_str_list(nfc + [f"deployment:{ctx}"]) if ctx else list(nfc)
+
+
+# Mots-clés (sous-chaînes) associant une user story à un module
+_STORY_KEYWORDS: Dict[str, List[str]] = {
+    "api": ["api", "endpoint", "route", "http", "rest", "graphql"],
+    "auth": ["auth", "login", "token", "jwt", "sso", "identity", "identité"],
+    "reports": ["report", "rapport", "pdf", "export"],
+    "billing": ["billing", "paiement", "payment", "facture", "invoice"],
+    "ui_layer": ["ui", "interface", "console", "web", "screen"],
+    "core": ["core", "métier", "business", "domain"],
+    "utils": ["outil", "helper", "utils"],
+    "tests": ["test", "qa", "quality"],
+}
+
+# Une alternation compilée par module : une seule passe C par story
+_MODULE_KW_RE: Dict[str, "re.Pattern[str]"] = {
+    name: re.compile("|".join(map(re.escape, kws)), re.IGNORECASE)
+    for name, kws in _STORY_KEYWORDS.items()
+}
+
+
+def _build_story_index(stories_lower: List[Tuple[Any, str]]) -> Dict[str, Any]:
+    """Index inverse module → id de la première story correspondante (une passe).
+
+    Paramètres
+    ----------
+    stories_lower : List[Tuple[Any, str]]
+        Stories de l'EC sous forme `(id, story_en_minuscules)`.
 
+    Retour
+    ------
+    Dict[str, Any]
+        `{module_name: user_story_id}` pour les modules ayant au moins une story.
+    """
+    index: Dict[str, Any] = {}
+    for us_id, text in stories_lower:
+        for name, rx in _MODULE_KW_RE.items():
+            if name not in index and rx.search(text):
+                index[name] = us_id
+        if len(index) == len(_MODULE_KW_RE):
+            break
+    return index
 
-def _user_story_for_module(ec: Dict[str, Any], module_name: str) -> Optional[str]:
+
+def _user_story_for_module(ec_ctx: Dict[str, Any], module_name: str) -> Optional[str]:
     """Associe une user_story pertinente au module par recherche de mots-clés.
 
     Paramètres
     ----------
-    ec : Dict[str, Any]
-        ExecutionContext (user_stories[] avec champs {id, story}).
+    ec_ctx : Dict[str, Any]
+        Contexte EC (`story_index` module → id, `stories_lower` pour le repli).
     module_name : str
         Nom du module.
 
@@ -475,35 +822,80 @@ def _user_story_for_module(ec: Dict[str, Any], module_name: str) -> Optional[str
     Optional[str]
         user_story_id si trouvée, sinon None.
     """
-    stories: List[Dict[str, Any]] = ec.get("user_stories") or []
-    text_map = {
-        "api": ["api", "endpoint", "route", "http", "rest", "graphql"],
-        "auth": ["auth", "login", "token", "jwt", "sso", "identity", "identité"],
-        "reports": ["report", "rapport", "pdf", "export"],
-        "billing": ["billing", "paiement", "payment", "facture", "invoice"],
-        "ui_layer": ["ui", "interface", "console", "web", "screen"],
-        "core": ["core", "métier", "business", "domain"],
-        "utils": ["outil", "helper", "utils"],
-        "tests": ["test", "qa", "quality"],
-    }
-    keywords = text_map.get(module_name, [])
-    for us in stories:
-        text = (us.get("story") or "").lower()
-        if any(k in text for k in keywords):
-            return us.get("id")
+    index = ec_ctx["story_index"]
+    if module_name in index:
+        return index[module_name]
     # fallback : première story si aucune correspondance
-    return stories[0]["id"] if stories and stories[0].get("id") else None
+    stories_lower = ec_ctx["stories_lower"]
+    return stories_lower[0][0] if stories_lower and stories_lower[0][0] else None
+
+
+def _build_text_index(ec: Dict[str, Any]) -> Tuple[str, List[Tuple[Any, str]]]:
+    """Construit une fois les textes EC en minuscules utilisés par les heuristiques.
+
+    Paramètres
+    ----------
+    ec : Dict[str, Any]
+        ExecutionContext (functional_objectives, user_stories[]).
+
+    Retour
+    ------
+    Tuple[str, List[Tuple[Any, str]]]
+        (objectifs + stories joints en minuscules, [(id, story_en_minuscules), ...]).
+    """
+    stories = [us for us in (ec.get("user_stories") or []) if isinstance(us, dict)]
+    stories_lower = [(us.get("id"), str(us.get("story") or "").lower()) for us in stories]
+    joined_lower = " ".join([
+        " ".join(ec.get("functional_objectives") or []),
+        " ".join(str(us.get("story") or "") for us in stories),
+    ]).lower()
+    return joined_lower, stories_lower
 
 
 # -----------------------------------------------------------------------------
 # Construction du module_draft
 # -----------------------------------------------------------------------------
 
+def _build_ec_ctx(ec: Dict[str, Any], *, now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """Pré-calcule les invariants EC partagés par tous les modules d'un lot.
+
+    Paramètres
+    ----------
+    ec : Dict[str, Any]
+        ExecutionContext chargé.
+    now_iso : Optional[str]
+        Horodatage du lot ; `_now_iso()` si None.
+
+    Retour
+    ------
+    Dict[str, Any]
+        Contexte `ec_ctx` : technical_constraints, nfo, ec_inputs, ec_outputs,
+        text_lower, stories_lower, story_index, loop_iteration, bus_message_id, spec_version, now_iso.
+    """
+    text_lower, stories_lower = _build_text_index(ec)
+    nfo = _dedup_str_list(ec.get("non_functional_constraints") or [])
+    return {
+        "technical_constraints": _technical_constraints(ec, nfo),
+        "nfo": nfo,
+        "ec_inputs": _dedup_str_list(ec.get("input_sources") or []),
+        "ec_outputs": _dedup_str_list(ec.get("output_targets") or []),
+        "text_lower": text_lower,
+        "stories_lower": stories_lower,
+        "story_index": _build_story_index(stories_lower),
+        "loop_iteration": int(ec.get("loop_iteration") or 0),
+        "bus_message_id": ec.get("bus_message_id"),
+        "spec_version": ec.get("spec_version"),
+        "now_iso": now_iso or _now_iso(),
+    }
+
+
 def build_module_draft(
     *,
     ec: Dict[str, Any],
     pd: Dict[str, Any],
     module_name: str,
+    ec_ctx: Optional[Dict[str, Any]] = None,
+    now_iso: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Construit un dictionnaire `module_draft` déterministe pour un module donné.
 
@@ -515,20 +907,28 @@ def build_module_draft(
         Section `project_draft` (peut être vide).
     module_name : str
         Nom du module à planifier.
+    ec_ctx : Optional[Dict[str, Any]]
+        Invariants EC pré-calculés (cf. `_build_ec_ctx`) ; calculés ici si None.
+    now_iso : Optional[str]
+        Horodatage du lot pour `meta.comment` ; à défaut celui de `ec_ctx`.
 
     Retour
     ------
     Dict[str, Any]
         Document YAML prêt à sérialiser sous la racine `module_draft`.
     """
+    # clé des tables _PHASE_MAP/_FILES_MAP/... : interner → comparaison par pointeur
+    module_name = sys.intern(str(module_name))
+    if ec_ctx is None:
+        ec_ctx = _build_ec_ctx(ec, now_iso=now_iso)
+    stamp = now_iso or ec_ctx["now_iso"]
     present = list(pd.get("initial_modules") or [])
-    responsibilities = _responsibilities_for_module(ec, module_name)
+    responsibilities = _responsibilities_for_module(ec_ctx["text_lower"], module_name)
     files_expected = _files_for_module(module_name, present)
     entrypoint = _entrypoint_for_module(module_name)
     depends_on = _dependencies_for_module(pd, module_name)
-    inputs, outputs = _inputs_outputs_for_module(ec, module_name)
-    constraints = _technical_constraints(ec)
-    user_story_id = _user_story_for_module(ec, module_name)
+    inputs, outputs = _inputs_outputs_for_module(ec_ctx, module_name)
+    user_story_id = _user_story_for_module(ec_ctx, module_name)
     priority = _priority_for_module(pd, module_name)
     phase = _phase_for_module(module_name)
 
@@ -542,16 +942,16 @@ def build_module_draft(
             "files_expected": files_expected,
             "entrypoint": entrypoint,
             "depends_on": depends_on,
-            "technical_constraints": constraints,
-            "non_functional_objectives": _dedup_str_list(ec.get("non_functional_constraints") or []),
+            "technical_constraints": list(ec_ctx["technical_constraints"]),
+            "non_functional_objectives": list(ec_ctx["nfo"]),
             "validator_status": "pending",
             "meta": {
                 "priority": priority,
                 "phase": phase,
-                "comment": f"Draft généré le { _now_iso() }",
-                "loop_iteration": int(ec.get("loop_iteration") or 0),
-                "bus_message_id": ec.get("bus_message_id"),
-                "spec_version_ref": ec.get("spec_version"),
+                "comment": f"Draft généré le {stamp}",
+                "loop_iteration": ec_ctx["loop_iteration"],
+                "bus_message_id": ec_ctx["bus_message_id"],
+                "spec_version_ref": ec_ctx["spec_version"],
             },
         }
     }
@@ -562,6 +962,10 @@ def build_module_draft(
 # Écriture / chemins de sortie
 # -----------------------------------------------------------------------------
 
+# Nombre de threads d'écriture pour `plan-all`
+_WRITE_WORKERS = 4
+
+
 def _module_out_path(out_root: Path, module_name: str) -> Path:
     """Calcule le chemin de sortie canonicalisé pour un module_draft.
 
@@ -587,6 +991,8 @@ def write_module_draft(
     module_name: str,
     out_root: Path,
     overwrite: bool,
+    ec_ctx: Optional[Dict[str, Any]] = None,
+    now_iso: Optional[str] = None,
 ) -> Path:
     """Construit et persiste un `module_draft.yaml` pour un module donné.
 
@@ -602,6 +1008,10 @@ def write_module_draft(
         Racine de sortie (par défaut `.archcode/modules`).
     overwrite : bool
         Écraser un fichier existant si True.
+    ec_ctx : Optional[Dict[str, Any]]
+        Invariants EC pré-calculés, partagés par un lot `plan-all`.
+    now_iso : Optional[str]
+        Horodatage commun du lot (sinon calculé à la construction).
 
     Retour
     ------
@@ -614,13 +1024,125 @@ def write_module_draft(
         Si le fichier existe et `overwrite` est False.
     """
     path = _module_out_path(out_root, module_name)
-    if path.exists() and not overwrite:
-        raise FileExistsError(f"Existe déjà (utilisez --overwrite) : {path}")
-    doc = build_module_draft(ec=ec, pd=pd, module_name=module_name)
-    _write_yaml(doc, path)
+    doc = build_module_draft(ec=ec, pd=pd, module_name=module_name, ec_ctx=ec_ctx, now_iso=now_iso)
+    try:
+        _write_yaml(doc, path, exclusive=not overwrite)
+    except FileExistsError:
+        raise FileExistsError(f"Existe déjà (utilisez --overwrite) : {path}") from None
     return path
 
 
+# -----------------------------------------------------------------------------
+# Mémoïsation des drafts (EC + PD inchangés → simple copie)
+# -----------------------------------------------------------------------------
+
+def _plan_ctx_key(ec: Dict[str, Any], pd: Dict[str, Any]) -> Optional[str]:
+    """Calcule la clé de mémoïsation d'un lot : hash(EC, PD, source de l'agent).
+
+    La source de l'agent est incluse pour invalider le cache dès qu'une
+    heuristique change.
+
+    Paramètres
+    ----------
+    ec : Dict[str, Any]
+        ExecutionContext chargé.
+    pd : Dict[str, Any]
+        Section `project_draft`.
+
+    Retour
+    ------
+    Optional[str]
+        Empreinte hexadécimale (blake2b, 16 octets), ou None si EC/PD ne sont
+        pas sérialisables de façon canonique (cache désactivé).
+    """
+    try:
+        payload = json.dumps({"ec": ec, "pd": pd}, sort_keys=True, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return None
+    h = hashlib.blake2b(payload.encode("utf-8"), digest_size=16)
+    try:
+        h.update(Path(__file__).read_bytes())
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+# Racine des drafts mémoïsés (sous `.archcode/.cache`, ignoré par Git)
+_CACHE_ROOT = Path(".archcode") / ".cache" / "module_draft"
+
+# Horodatage neutre stocké en cache à la place de celui du lot (même forme ISO,
+# donc même rendu YAML) ; remplacé par l'horodatage courant à la relecture.
+_CACHE_STAMP = "0000-00-00T00:00:00"
+
+
+def _cache_dir(ctx_key: str) -> Path:
+    """Dossier de cache d'un lot : `.archcode/.cache/module_draft/<ctx_key>`.
+
+    Paramètres
+    ----------
+    ctx_key : str
+        Clé calculée par `_plan_ctx_key`.
+
+    Retour
+    ------
+    Path
+        Dossier contenant les `<module_name>.yaml` mémoïsés.
+    """
+    return _CACHE_ROOT / ctx_key
+
+
+def _stamp_marker(stamp: str) -> bytes:
+    """Fragment de `meta.comment` portant l'horodatage (ASCII, jamais échappé)."""
+    return f" le {stamp}".encode("ascii")
+
+
+def _write_plan_job(
+    path: Path,
+    doc: Optional[Dict[str, Any]],
+    cached: Optional[Path],
+    exclusive: bool,
+    now: str,
+) -> bool:
+    """Matérialise un draft : copie depuis le cache (doc None) ou écriture + mise en cache.
+
+    Le cache ne conserve pas l'horodatage du lot qui l'a produit : `meta.comment`
+    y porte `_CACHE_STAMP`, remplacé par `now` lors d'une copie.
+
+    Paramètres
+    ----------
+    path : Path
+        Destination `.../<module_name>/module_draft.yaml`.
+    doc : Optional[Dict[str, Any]]
+        Document à écrire (horodaté `now`) ; None si `cached` contient déjà le résultat.
+    cached : Optional[Path]
+        Entrée de cache correspondante (None si cache désactivé).
+    exclusive : bool
+        Ne pas écraser une destination existante (pas d'--overwrite).
+    now : str
+        Horodatage du lot.
+
+    Retour
+    ------
+    bool
+        True si écrit, False si la destination existait déjà (mode exclusif).
+    """
+    if doc is None and cached is not None:
+        data = cached.read_bytes().replace(_stamp_marker(_CACHE_STAMP), _stamp_marker(now), 1)
+    else:
+        data = _dump_yaml_bytes(doc or {})
+    try:
+        _write_bytes(data, path, exclusive=exclusive)
+    except FileExistsError:
+        return False
+    marker = _stamp_marker(now)
+    if doc is not None and cached is not None and marker in data:
+        try:
+            _write_bytes(data.replace(marker, _stamp_marker(_CACHE_STAMP), 1), cached)
+        except OSError:
+            pass
+    return True
+
+
 # -----------------------------------------------------------------------------
 # Commandes haut niveau
 # -----------------------------------------------------------------------------
@@ -688,15 +1210,55 @@ def cmd_plan_all(
     if not modules:
         print("[INFO] Aucun module déclaré dans project_draft.initial_modules.")
         return
-    ok = 0
+    # invariants EC (dont un horodatage unique) calculés une fois pour tout le lot
+    now = _now_iso()
+    ec_ctx = _build_ec_ctx(ec, now_iso=now)
+    ctx_key = _plan_ctx_key(ec, pd)
+    cache = _cache_dir(ctx_key) if ctx_key else None
+
+    # 1) construction des documents (CPU, sauf cache) ; l'existence est contrôlée
+    #    à la création (O_EXCL) quand --overwrite est absent
+    outcomes: List[Tuple[str, Path]] = []
+    jobs: Dict[Path, Tuple[Optional[Dict[str, Any]], Optional[Path]]] = {}
     for m in modules:
-        try:
-            out = write_module_draft(ec=ec, pd=pd, module_name=str(m), out_root=out_root, overwrite=overwrite)
-            print(f"[OK] {m:12s} → {out}")
+        name = str(m)
+        path = _module_out_path(out_root, name)
+        outcomes.append((name, path))
+        if path in jobs:
+            # doublon dans initial_modules : même document, écrit une seule fois
+            continue
+        cached = cache / f"{name}.yaml" if cache is not None else None
+        if cached is not None and cached.is_file():
+            jobs[path] = (None, cached)
+        else:
+            jobs[path] = (build_module_draft(ec=ec, pd=pd, module_name=name, ec_ctx=ec_ctx), cached)
+
+    # 2) écritures disque en parallèle (le GIL est relâché pendant les I/O)
+    written: Dict[Path, bool] = {}
+    if jobs:
+        exclusive = not overwrite
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as ex:
+            results = ex.map(lambda job: _write_plan_job(job[0], *job[1], exclusive, now), jobs.items())
+            written = dict(zip(jobs.keys(), results))
+
+    # 3) compte rendu (ordre des modules déclarés) émis en une seule écriture
+    ok = 0
+    seen: set = set()
+    lines: List[str] = []
+    for name, path in outcomes:
+        # un doublon n'est « écrit » qu'avec --overwrite (comportement historique)
+        if written.get(path) and (path not in seen or overwrite):
+            lines.append(f"[OK] {name:12s} → {path}")
             ok += 1
-        except FileExistsError as e:
-            print(f"[SKIP] {e}")
-    print(f"[DONE] Planification terminée : {ok}/{len(modules)} module(s) généré(s).")
+        else:
+            lines.append(f"[SKIP] Existe déjà (utilisez --overwrite) : {path}")
+        seen.add(path)
+    lines.append(f"[DONE] Planification terminée : {ok}/{len(modules)} module(s) généré(s).")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Scalaires nuls tels que rendus (non résolus) par BaseLoader
+_NULL_SCALARS = frozenset({"", "~", "null", "Null", "NULL"})
 
 
 def cmd_show(md_path: Path) -> None:
@@ -711,17 +1273,23 @@ def cmd_show(md_path: Path) -> None:
     ------
     None
     """
-    doc = _read_yaml(md_path)
+    # affichage seul : BaseLoader (pas de résolution de types, tout scalaire est str)
+    doc = _get_yaml().load(md_path.read_bytes(), Loader=_BaseLoader) or {}
     md = doc.get("module_draft") or {}
+    meta = md.get("meta") or {}
+
+    def val(v: Any) -> Any:
+        return None if v in _NULL_SCALARS else v
+
     print("\n".join([
-        f"module_name      : {md.get('module_name')}",
-        f"user_story_id    : {md.get('user_story_id')}",
+        f"module_name      : {val(md.get('module_name'))}",
+        f"user_story_id    : {val(md.get('user_story_id'))}",
         f"files_expected   : {', '.join(md.get('files_expected') or []) or '∅'}",
         f"depends_on       : {', '.join(md.get('depends_on') or []) or '∅'}",
-        f"entrypoint       : {md.get('entrypoint')}",
-        f"validator_status : {md.get('validator_status')}",
-        f"priority         : {(md.get('meta') or {}).get('priority')}",
-        f"phase            : {(md.get('meta') or {}).get('phase')}",
+        f"entrypoint       : {val(md.get('entrypoint'))}",
+        f"validator_status : {val(md.get('validator_status'))}",
+        f"priority         : {val(meta.get('priority'))}",
+        f"phase            : {val(meta.get('phase'))}",
     ]))
 
 
@@ -729,20 +1297,8 @@ def cmd_show(md_path: Path) -> None:
 # CLI
 # -----------------------------------------------------------------------------
 
-def _build_parser() -> argparse.ArgumentParser:
-    """Construit le parseur d'arguments pour plan/plan-all/show.
-
-    Retour
-    ------
-    argparse.ArgumentParser
-        Parseur configuré avec ses sous-commandes et options.
-    """
-    p = argparse.ArgumentParser(
-        prog="agent_module_planner",
-        description="ARCHCode — Planifie des modules → module_draft.yaml (déterministe, sans LLM).",
-    )
-    sub = p.add_subparsers(dest="cmd", required=True)
-
+def _add_plan_parser(sub: Any) -> None:
+    """Déclare la sous-commande `plan`."""
     sp_plan = sub.add_parser("plan", help="Planifier un module unique")
     sp_plan.add_argument("module_name", type=str, help="Nom du module à planifier")
     sp_plan.add_argument("--ec", type=Path, default=Path(".archcode") / "execution_context.yaml",
@@ -753,6 +1309,9 @@ def _build_parser() -> argparse.ArgumentParser:
                          help="Racine de sortie des modules")
     sp_plan.add_argument("--overwrite", action="store_true", help="Écraser si le fichier existe déjà")
 
+
+def _add_plan_all_parser(sub: Any) -> None:
+    """Déclare la sous-commande `plan-all`."""
     sp_plan_all = sub.add_parser("plan-all", help="Planifier tous les modules déclarés")
     sp_plan_all.add_argument("--ec", type=Path, default=Path(".archcode") / "execution_context.yaml",
                              help="Chemin vers .archcode/execution_context.yaml")
@@ -762,9 +1321,44 @@ def _build_parser() -> argparse.ArgumentParser:
                              help="Racine de sortie des modules")
     sp_plan_all.add_argument("--overwrite", action="store_true", help="Écraser les fichiers existants")
 
+
+def _add_show_parser(sub: Any) -> None:
+    """Déclare la sous-commande `show`."""
     sp_show = sub.add_parser("show", help="Afficher un résumé d’un module_draft.yaml")
     sp_show.add_argument("path", type=Path, help="Chemin vers un module_draft.yaml")
 
+
+_SUBPARSERS = {
+    "plan": _add_plan_parser,
+    "plan-all": _add_plan_all_parser,
+    "show": _add_show_parser,
+}
+
+
+def _build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Construit le parseur d'arguments pour plan/plan-all/show.
+
+    Paramètres
+    ----------
+    only : Optional[str]
+        Sous-commande déjà identifiée : seule celle-ci est déclarée.
+        None (aide, commande inconnue) → parseur complet.
+
+    Retour
+    ------
+    argparse.ArgumentParser
+        Parseur configuré avec ses sous-commandes et options.
+    """
+    p = argparse.ArgumentParser(
+        prog="agent_module_planner",
+        description="ARCHCode — Planifie des modules → module_draft.yaml (déterministe, sans LLM).",
+    )
+    sub = p.add_subparsers(dest="cmd", required=True)
+    if only in _SUBPARSERS:
+        _SUBPARSERS[only](sub)
+    else:
+        for add in _SUBPARSERS.values():
+            add(sub)
     return p
 
 
@@ -784,7 +1378,10 @@ def main(argv: Optional[List[str]] = None) -> None:
     ------
     Exécute la sous-commande demandée et gère les erreurs courantes.
     """
-    parser = _build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    # construction paresseuse : seule la sous-commande demandée est déclarée
+    parser = _build_parser(only=argv[0] if argv else None)
     args = parser.parse_args(argv)
     try:
         if args.cmd == "plan":
@@ -811,7 +1408,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     except FileNotFoundError as e:
         print(f"[ERREUR] {e}")
         raise SystemExit(1)
-    except yaml.YAMLError as e:
+    except _get_yaml().YAMLError as e:
         print(f"[ERREUR YAML] {e}")
         raise SystemExit(2)
     except (ValueError, FileExistsError) as e:
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import argparse
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Final, FrozenSet, Iterator, List, Optional, Tuple
 from datetime import datetime
 import fnmatch
+import json
 import os
 import re
 import yaml
 
+try:  # libyaml (C) si disponible, sinon implémentations pure-Python
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # pragma: no cover - PyYAML sans libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+try:  # sérialisation JSON rapide (optionnelle)
+    import orjson
+except ImportError:  # pragma: no cover - repli stdlib
+    orjson = None
+
 """
 ===============================================================================
 ARCHCode — agent_module_validator (PHASE 2 : Validation locale des modules)
@@ -35,6 +49,8 @@ Entrées :
 
 Sorties :
   - `comment_module_validator.yaml` à côté du module_draft
+    (ou `comment_module_validator.json` si ARCHCODE_COMMENT_FORMAT=json ;
+    orjson si disponible, sinon json stdlib)
   - Mise à jour (optionnelle) du champ `validator_status` dans le module_draft
   - Codes de sortie CLI adaptés (0 = succès de la commande, pas du verdict)
 
@@ -62,30 +78,52 @@ def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    """Charge un fichier YAML en dict ({} si vide)."""
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+@lru_cache(maxsize=128)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse un fichier YAML ; la clé (chemin, mtime_ns, taille) invalide le cache."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f.read(), Loader=_Loader)
     return data or {}
 
 
-def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
-    """Écrit un dict dans un fichier YAML (crée les dossiers si besoin)."""
+def _read_yaml(path: Path) -> Dict[str, Any]:
+    """Charge un fichier YAML en dict ({} si vide).
+
+    Les fichiers inchangés (même mtime_ns et taille) ne sont pas re-parsés ;
+    une copie profonde est renvoyée car les appelants modifient le document.
+    """
+    path = path.resolve()
+    st = path.stat()
+    return copy.deepcopy(_parse_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+def _write_bytes_atomic(data: bytes, path: Path) -> None:
+    """Écrit `data` d'un bloc dans un fichier temporaire puis le renomme (os.replace).
+
+    Un lecteur concurrent ne voit jamais de fichier partiellement écrit.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(doc, f, sort_keys=False, allow_unicode=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
+    """Écrit un dict dans un fichier YAML, de façon atomique (crée les dossiers si besoin)."""
+    text = yaml.dump(doc, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+    _write_bytes_atomic(text.encode("utf-8"), path)
 
 
 def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
     """Déduplique une liste de chaînes en préservant l’ordre."""
     if not values:
         return []
-    out, seen = [], set()
-    for v in values:
-        s = str(v).strip()
-        if s and s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+    stripped = (v.strip() if isinstance(v, str) else str(v).strip() for v in values)
+    return list(dict.fromkeys(s for s in stripped if s))
 
 
 # -----------------------------------------------------------------------------
@@ -109,6 +147,16 @@ def _load_pd(path: Path) -> Dict[str, Any]:
     return doc.get("project_draft") or {}
 
 
+def _ec_story_ids(ec: Dict[str, Any]) -> FrozenSet[str]:
+    """Index des `user_stories[].id` de l'EC (calculé une fois par lot)."""
+    return frozenset(str(us.get("id")) for us in (ec.get("user_stories") or []) if us.get("id"))
+
+
+def _pd_module_set(pd: Dict[str, Any]) -> FrozenSet[Any]:
+    """Index des `initial_modules` du project_draft (calculé une fois par lot)."""
+    return frozenset(pd.get("initial_modules") or ())
+
+
 # -----------------------------------------------------------------------------
 # Localisation des fichiers module_draft
 # -----------------------------------------------------------------------------
@@ -120,26 +168,67 @@ _DEFAULT_PATTERNS = [
     ".archcode/*_module_draft.yaml",
 ]
 
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile une liste de motifs glob en une seule alternation regex (sémantique fnmatch)."""
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+_PATTERNS_RE = _compile_patterns(tuple(_DEFAULT_PATTERNS))
+# Noms de feuille couvrant tous les motifs par défaut
+_DEFAULT_LEAF_NAME = "module_draft.yaml"
+_DEFAULT_LEAF_SUFFIX = "_module_draft.yaml"
+
+
+def _is_default_leaf(name: str) -> bool:
+    """Vrai si `name` peut correspondre à l'un des motifs par défaut."""
+    return name == _DEFAULT_LEAF_NAME or name.endswith(_DEFAULT_LEAF_SUFFIX)
+
+
+def _iter_files(root: str, name_ok: Optional[Callable[[str], bool]]) -> Iterator[Tuple[str, str]]:
+    """Parcourt `root` via os.scandir et produit (chemin, chemin relatif) des fichiers.
+
+    Le type des entrées provient de readdir (pas de stat supplémentaire) ;
+    les liens symboliques vers des dossiers ne sont pas suivis.
+    """
+    cut = len(os.path.join(root, ""))  # séparateur final ajouté seulement s'il manque (`/`, `C:\\`)
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (name_ok is None or name_ok(entry.name)) and entry.is_file():
+                    yield entry.path, entry.path[cut:]
+
+
 def _find_module_drafts(roots: List[Path], patterns: Optional[List[str]] = None) -> List[Path]:
-    """Recherche récursivement des fichiers module_draft selon plusieurs motifs."""
-    patterns = patterns or _DEFAULT_PATTERNS
+    """Recherche récursivement des fichiers module_draft selon plusieurs motifs.
+
+    Motifs par défaut : seuls les fichiers nommés `module_draft.yaml` /
+    `*_module_draft.yaml` sont retenus avant le test de la regex.
+    Motifs utilisateur : tous les fichiers sont testés.
+    """
+    match = _compile_patterns(tuple(patterns)).match if patterns else _PATTERNS_RE.match
+    name_ok = None if patterns else _is_default_leaf
+    normcase = os.path.normcase
     found: List[Path] = []
     seen: set[str] = set()
     for root in roots:
         root = root.resolve()
         if not root.exists():
             continue
-        for p in root.rglob("*"):
-            if not p.is_file():
-                continue
-            rel = str(p.relative_to(root))
-            for pat in patterns:
-                if fnmatch.fnmatch(rel, pat):
-                    rp = str(p.resolve())
-                    if rp not in seen:
-                        seen.add(rp)
-                        found.append(p.resolve())
-                    break
+        for path, rel in _iter_files(str(root), name_ok):
+            if match(normcase(rel)):
+                p = Path(path).resolve()
+                rp = str(p)
+                if rp not in seen:
+                    seen.add(rp)
+                    found.append(p)
     return found
 
 
@@ -147,21 +236,35 @@ def _find_module_drafts(roots: List[Path], patterns: Optional[List[str]] = None)
 # Règles de validation (déterministes)
 # -----------------------------------------------------------------------------
 
-_ALLOWED_FILE_EXT = {".py", ".md", ".txt", ".yml", ".yaml", ".json", ".ini"}
-_MOD_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+_ALLOWED_FILE_EXT: Final[FrozenSet[str]] = frozenset({".py", ".md", ".txt", ".yml", ".yaml", ".json", ".ini"})
+_MOD_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*\Z")
+_MOD_NAME_MATCH = _MOD_NAME_RE.match
+_ENTRYPOINT_REQUIRED_MODULES: Final[FrozenSet[str]] = frozenset({"api", "ui_layer"})
+_BAD_PARENT = re.compile(r"(?:^|/)\.\.(?:/|$)")
 
 def _extract_module(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Extrait la section `module_draft` ou tolère une racine équivalente."""
-    if isinstance(doc, dict) and "module_draft" in doc and isinstance(doc["module_draft"], dict):
-        return doc["module_draft"]
-    if isinstance(doc, dict) and "module_name" in doc:
-        return doc
-    return None
+    if not isinstance(doc, dict):
+        return None
+    md = doc.get("module_draft")
+    if isinstance(md, dict):
+        return md
+    return doc if "module_name" in doc else None
 
 
 def _ext(path: str) -> str:
     """Retourne l’extension (minuscule) du fichier."""
-    return os.path.splitext(path)[1].lower()
+    i = path.rfind(".")
+    return path[i:].lower() if i >= 0 and "/" not in path[i:] else ""
+
+
+# (strict_weak, fail_on_warn avec warnings) → verdict, en l'absence d'erreurs
+_VERDICT_TABLE: Final[Dict[Tuple[bool, bool], str]] = {
+    (False, False): "ok",
+    (False, True): "rejected",
+    (True, False): "pending",
+    (True, True): "pending",
+}
 
 
 def _validate_module_draft(
@@ -171,27 +274,32 @@ def _validate_module_draft(
     pd: Dict[str, Any],
     strict: bool,
     fail_on_warn: bool,
+    ec_story_ids: Optional[FrozenSet[str]] = None,
+    pd_mods: Optional[FrozenSet[Any]] = None,
 ) -> Tuple[str, List[str], List[str], List[str]]:
     """
     Applique des règles déterministes et retourne (verdict, errors, warnings, suggestions).
 
     - `verdict` : "ok" | "pending" | "rejected"
+    - `ec_story_ids` / `pd_mods` : index précalculés (sinon dérivés de `ec` / `pd`)
     """
     errors: List[str] = []
     warns: List[str] = []
     suggs: List[str] = []
 
     # --- Champs obligatoires minimaux
-    name = str(md.get("module_name") or "").strip()
+    name: str = str(md.get("module_name") or "").strip()
     if not name:
         errors.append("Champ `module_name` manquant ou vide.")
-    elif not _MOD_NAME_RE.match(name):
+    elif not _MOD_NAME_MATCH(name):
         errors.append(f"`module_name` invalide : {name!r} (attendu : [A-Za-z][A-Za-z0-9_]*).")
 
-    files = md.get("files_expected")
+    files: Any = md.get("files_expected")
     if not isinstance(files, list) or not files:
         errors.append("Champ `files_expected[]` manquant ou vide.")
         files = []
+    deduped = _dedup_str_list(files)
+    files_set: FrozenSet[str] = frozenset(deduped)
 
     # --- Listes facultatives typées
     responsibilities = md.get("responsibilities")
@@ -215,21 +323,17 @@ def _validate_module_draft(
         errors.append("`entrypoint` doit être une chaîne si présent.")
     if isinstance(entrypoint, str) and entrypoint.strip():
         ep = entrypoint.strip()
-        if ":" in ep:
-            fpart = ep.split(":", 1)[0].strip()
-        else:
-            fpart = ep
-        if fpart not in files:
+        fpart = ep.partition(":")[0].strip()
+        if fpart not in files_set:
             warns.append(f"`entrypoint` réfère '{fpart}' qui n’est pas dans `files_expected[]`.")
 
     # --- Sanitation files_expected
-    deduped = _dedup_str_list(files)
-    bad_paths = []
-    ext_warns = 0
+    bad_paths: List[str] = []
+    ext_warns: int = 0
     for f in deduped:
-        if f.startswith("/") or f.startswith("\\"):
+        if f.startswith(("/", "\\")):
             bad_paths.append(f"chemin absolu interdit : {f}")
-        if ".." in f.split("/"):
+        if _BAD_PARENT.search(f):
             bad_paths.append(f"chemin parent '..' interdit : {f}")
         if _ext(f) not in _ALLOWED_FILE_EXT:
             ext_warns += 1
@@ -239,7 +343,8 @@ def _validate_module_draft(
         warns.append(f"{ext_warns} fichier(s) avec extension non standard (mode strict).")
 
     # --- Cohérence avec project_draft (dépendances existantes)
-    pd_mods = set(pd.get("initial_modules") or [])
+    if pd_mods is None:
+        pd_mods = _pd_module_set(pd)
     for dep in depends_on:
         dep_s = str(dep).strip()
         if not dep_s:
@@ -252,7 +357,7 @@ def _validate_module_draft(
     # --- user_story_id cohérente avec EC (si dispo)
     user_story_id = md.get("user_story_id")
     if user_story_id:
-        ec_ids = {str(us.get("id")) for us in (ec.get("user_stories") or []) if us.get("id")}
+        ec_ids = ec_story_ids if ec_story_ids is not None else _ec_story_ids(ec)
         if ec_ids and str(user_story_id) not in ec_ids:
             warns.append(f"`user_story_id` inconnue dans ExecutionContext : {user_story_id}")
 
@@ -272,22 +377,18 @@ def _validate_module_draft(
     if errors:
         verdict = "rejected"
     else:
-        if strict and (not responsibilities or ext_warns):
-            # strict peut forcer 'pending' si certains champs faibles
-            verdict = "pending"
-        elif fail_on_warn and warns:
-            verdict = "rejected"
-        else:
-            verdict = "ok"
+        # strict peut forcer 'pending' si certains champs faibles (prioritaire sur fail_on_warn)
+        strict_weak = strict and (not responsibilities or ext_warns > 0)
+        verdict = _VERDICT_TABLE[bool(strict_weak), bool(fail_on_warn and warns)]
 
     # --- Suggestions légères
     if not responsibilities:
         suggs.append("Ajouter des `responsibilities[]` pour clarifier le périmètre.")
     if name == "api" and "tests" not in pd_mods:
         suggs.append("Prévoir un module `tests` pour couvrir les endpoints.")
-    if name == "auth" and "tokens.py" not in files:
+    if name == "auth" and "tokens.py" not in files_set:
         suggs.append("Ajouter `tokens.py` pour centraliser la logique JWT/refresh.")
-    if entrypoint is None and name in {"api", "ui_layer"}:
+    if entrypoint is None and name in _ENTRYPOINT_REQUIRED_MODULES:
         suggs.append("Définir `entrypoint` (ex. `routes.py` ou `cli.py:main`).")
 
     return verdict, errors, warns, suggs
@@ -297,10 +398,58 @@ def _validate_module_draft(
 # Écriture du commentaire et mise à jour du module
 # -----------------------------------------------------------------------------
 
+# Format de l'artefact de commentaire : "yaml" (défaut) ou "json"
+_COMMENT_FORMAT = "json" if os.environ.get("ARCHCODE_COMMENT_FORMAT", "").strip().lower() == "json" else "yaml"
+
+
 def _comment_path_for(module_yaml: Path) -> Path:
     """Calcule le chemin du fichier de commentaire à côté du module_draft."""
     mod_dir = module_yaml.parent
-    return mod_dir / "comment_module_validator.yaml"
+    return mod_dir / f"comment_module_validator.{_COMMENT_FORMAT}"
+
+
+def _dump_comment_json(doc: Dict[str, Any]) -> bytes:
+    """Sérialise le commentaire en JSON indenté (orjson si disponible)."""
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(doc, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
+
+def _comment_scalar(value: Any) -> str:
+    """Sérialise un scalaire du commentaire (chaînes toujours entre guillemets doubles).
+
+    Lève ValueError hors schéma (→ repli sur `yaml.dump`).
+    """
+    if value is None:
+        return "null"
+    if value is True or value is False:
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, str) and value.isprintable():
+        return json.dumps(value, ensure_ascii=False)
+    raise ValueError(f"scalaire hors schéma : {type(value).__name__}")
+
+
+def _emit_comment_yaml(cmv: Dict[str, Any]) -> Optional[str]:
+    """Émet `comment_module_validator` par gabarit (schéma fixe, sans PyYAML).
+
+    Retourne None si une valeur sort du schéma.
+    """
+    out = ["comment_module_validator:"]
+    try:
+        for key, value in cmv.items():
+            if isinstance(value, list):
+                if not value:
+                    out.append(f"  {key}: []")
+                    continue
+                out.append(f"  {key}:")
+                out.extend(f"  - {_comment_scalar(v)}" for v in value)
+            else:
+                out.append(f"  {key}: {_comment_scalar(value)}")
+    except ValueError:
+        return None
+    return "\n".join(out) + "\n"
 
 
 def _write_comment(
@@ -312,15 +461,19 @@ def _write_comment(
     warns: List[str],
     suggs: List[str],
     ec: Dict[str, Any],
+    now_iso: Optional[str] = None,
 ) -> Path:
-    """Écrit `comment_module_validator.yaml` avec diagnostic complet."""
+    """Écrit `comment_module_validator.yaml` avec diagnostic complet.
+
+    `now_iso` : horodatage partagé par un lot (sinon l'instant courant).
+    """
     name = str(md.get("module_name") or "∅")
     meta = md.get("meta") or {}
     doc = {
         "comment_module_validator": {
             "module_name": name,
             "status": verdict,
-            "checked_at": _now_iso(),
+            "checked_at": now_iso or _now_iso(),
             "bus_message_id": meta.get("bus_message_id") or ec.get("bus_message_id"),
             "spec_version_ref": meta.get("spec_version_ref") or ec.get("spec_version"),
             "loop_iteration": meta.get("loop_iteration"),
@@ -336,14 +489,70 @@ def _write_comment(
         }
     }
     path = _comment_path_for(module_yaml)
-    _write_yaml(doc, path)
+    if _COMMENT_FORMAT == "json":
+        _write_bytes_atomic(_dump_comment_json(doc), path)
+        return path
+    text = _emit_comment_yaml(doc["comment_module_validator"])
+    if text is None:
+        _write_yaml(doc, path)
+    else:
+        _write_bytes_atomic(text.encode("utf-8"), path)
     return path
 
 
+_MD_HEADER_RE = re.compile(r"module_draft:[ \t]*(?:#.*)?")
+_STATUS_LINE_RE = re.compile(r"([ \t]+)validator_status[ \t]*:[ \t]*\S*[ \t]*(\r?\n)?")
+_KEY_INDENT_RE = re.compile(r"[ \t]*")
+
+
+def _patch_validator_status(text: str, verdict: str) -> Optional[str]:
+    """Réécrit `validator_status` ligne à ligne sous `module_draft:` (sans parse YAML).
+
+    Préserve commentaires et ordre des clés. Retourne None si la structure
+    n'est pas reconnue (→ réécriture complète par l'appelant).
+    """
+    lines = text.splitlines(keepends=True)
+    start = next((i for i, ln in enumerate(lines) if _MD_HEADER_RE.fullmatch(ln.rstrip("\r\n"))), None)
+    if start is None:
+        return None
+    indent = None
+    for i in range(start + 1, len(lines)):
+        body = lines[i].rstrip("\r\n")
+        stripped = body.lstrip(" \t")
+        if not stripped or stripped.startswith("#"):
+            continue
+        if len(stripped) == len(body):
+            break  # clé de niveau racine : fin du bloc module_draft
+        cur = _KEY_INDENT_RE.match(body).group(0)
+        if indent is None:
+            indent = cur
+        if cur != indent:
+            continue
+        m = _STATUS_LINE_RE.fullmatch(lines[i])
+        if m:
+            lines[i] = f"{indent}validator_status: {verdict}{m.group(2) or ''}"
+            return "".join(lines)
+        if stripped.startswith("validator_status"):
+            return None  # valeur non triviale (guillemets, commentaire…)
+    if indent is None:
+        return None
+    eol = "\r\n" if lines[start].endswith("\r\n") else "\n"
+    if not lines[start].endswith(eol):
+        lines[start] += eol
+    lines.insert(start + 1, f"{indent}validator_status: {verdict}{eol}")
+    return "".join(lines)
+
+
 def _update_validator_status(module_yaml: Path, verdict: str) -> None:
-    """Met à jour in-place `validator_status` dans le module_draft."""
+    """Met à jour in-place `validator_status` dans le module_draft.
+
+    Réécriture ligne à ligne si possible ; sinon parse + dump complet.
+    """
+    text = _patch_validator_status(module_yaml.read_bytes().decode("utf-8"), verdict)
+    if text is not None:
+        _write_bytes_atomic(text.encode("utf-8"), module_yaml)
+        return
     doc = _read_yaml(module_yaml)
-    md = _extract_module(doc) or {}
     if "module_draft" in doc:
         doc["module_draft"]["validator_status"] = verdict
     else:
@@ -355,37 +564,93 @@ def _update_validator_status(module_yaml: Path, verdict: str) -> None:
 # Commandes haut niveau
 # -----------------------------------------------------------------------------
 
-def validate_single(
+def _validate_file(
     *,
     module_yaml: Path,
-    ec_path: Path,
-    pd_path: Path,
+    ec: Dict[str, Any],
+    pd: Dict[str, Any],
     strict: bool,
     fail_on_warn: bool,
     write_status: bool,
+    log: Callable[[str], None] = print,
+    ec_story_ids: Optional[FrozenSet[str]] = None,
+    pd_mods: Optional[FrozenSet[Any]] = None,
+    now_iso: Optional[str] = None,
 ) -> str:
-    """Valide un module_draft unique et retourne le verdict."""
-    ec = _load_ec(ec_path)
-    pd = _load_pd(pd_path)
+    """Valide un module_draft avec EC/PD déjà chargés et retourne le verdict.
+
+    `ec_story_ids` / `pd_mods` / `now_iso` : précalculés une fois par `validate_all`.
+    `log` reçoit les messages de progression (print par défaut ; les workers
+    de `validate_all` les collectent pour un affichage ordonné).
+    """
     doc = _read_yaml(module_yaml)
     md = _extract_module(doc)
     if not md:
         raise ValueError(f"{module_yaml} n’est pas un module_draft valide.")
 
     verdict, errors, warns, suggs = _validate_module_draft(
-        md, ec=ec, pd=pd, strict=strict, fail_on_warn=fail_on_warn
+        md, ec=ec, pd=pd, strict=strict, fail_on_warn=fail_on_warn,
+        ec_story_ids=ec_story_ids, pd_mods=pd_mods,
     )
     cpath = _write_comment(
         module_yaml=module_yaml, md=md, verdict=verdict,
-        errors=errors, warns=warns, suggs=suggs, ec=ec
+        errors=errors, warns=warns, suggs=suggs, ec=ec, now_iso=now_iso,
     )
-    print(f"[OK] Commentaire écrit → {cpath} [{verdict}]")
+    log(f"[OK] Commentaire écrit → {cpath} [{verdict}]")
     if write_status:
         _update_validator_status(module_yaml, verdict)
-        print(f"[OK] validator_status mis à jour → {module_yaml}")
+        log(f"[OK] validator_status mis à jour → {module_yaml}")
     return verdict
 
 
+def _validate_worker(
+    module_yaml: Path,
+    *,
+    ec: Dict[str, Any],
+    pd: Dict[str, Any],
+    strict: bool,
+    fail_on_warn: bool,
+    write_status: bool,
+    ec_story_ids: Optional[FrozenSet[str]] = None,
+    pd_mods: Optional[FrozenSet[Any]] = None,
+    now_iso: Optional[str] = None,
+) -> Tuple[Optional[str], List[str]]:
+    """Unité de travail de `validate_all` (picklable) : (verdict | None si erreur, messages)."""
+    lines: List[str] = []
+    try:
+        verdict = _validate_file(
+            module_yaml=module_yaml, ec=ec, pd=pd, strict=strict,
+            fail_on_warn=fail_on_warn, write_status=write_status, log=lines.append,
+            ec_story_ids=ec_story_ids, pd_mods=pd_mods, now_iso=now_iso,
+        )
+        return verdict, lines
+    except Exception as e:
+        lines.append(f"[ERR ] {module_yaml}: {e}")
+        return None, lines
+
+
+def validate_single(
+    *,
+    module_yaml: Path,
+    ec_path: Path,
+    pd_path: Path,
+    strict: bool,
+    fail_on_warn: bool,
+    write_status: bool,
+) -> str:
+    """Valide un module_draft unique (EC/PD lus depuis le disque) et retourne le verdict."""
+    ec = _load_ec(ec_path)
+    pd = _load_pd(pd_path)
+    return _validate_file(
+        module_yaml=module_yaml, ec=ec, pd=pd,
+        strict=strict, fail_on_warn=fail_on_warn, write_status=write_status,
+    )
+
+
+# En deçà, le coût de démarrage des processus dépasse le gain
+_PARALLEL_MIN_FILES = 8
+
+
 def validate_all(
     *,
     roots: List[Path],
@@ -402,17 +667,33 @@ def validate_all(
         print("[INFO] Aucun module_draft.yaml trouvé.")
         return
 
+    # EC / PD : un seul parsing pour tout le lot
+    ec = _load_ec(ec_path)
+    pd = _load_pd(pd_path)
+
+    # Modules indépendants : validation en parallèle (processus) au-delà d'un
+    # petit lot ; messages et comptes agrégés dans l'ordre des fichiers.
+    work = partial(
+        _validate_worker, ec=ec, pd=pd,
+        strict=strict, fail_on_warn=fail_on_warn, write_status=write_status,
+        ec_story_ids=_ec_story_ids(ec), pd_mods=_pd_module_set(pd),
+        now_iso=_now_iso(),
+    )
+    workers = min(os.cpu_count() or 1, len(files))
+    if workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(work, files))
+    else:
+        results = [work(f) for f in files]
+
     counts = {"ok": 0, "pending": 0, "rejected": 0}
-    for f in files:
-        try:
-            v = validate_single(
-                module_yaml=f, ec_path=ec_path, pd_path=pd_path,
-                strict=strict, fail_on_warn=fail_on_warn, write_status=write_status
-            )
-            counts[v] = counts.get(v, 0) + 1
-        except Exception as e:
-            print(f"[ERR ] {f}: {e}")
+    for v, lines in results:
+        for line in lines:
+            print(line)
+        if v is None:
             counts["rejected"] += 1
+        else:
+            counts[v] = counts.get(v, 0) + 1
 
     total = sum(counts.values())
     print("\n— Résultat global —")
@@ -507,7 +788,7 @@ def main(argv: Optional[List[str]] = None) -> None:
                 ec_path=args.ec,
                 pd_path=args.pd,
                 strict=args.strict,
-                fail_on_warn=args.fail_on_w ar n if hasattr(args, "fail_on_warn") else False,  # defensive
+                fail_on_warn=args.fail_on_warn if hasattr(args, "fail_on_warn") else False,  # defensive
                 write_status=args.write_status,
             )
         elif args.cmd == "show":
@@ -1,13 +1,38 @@
 # agents/agent_plan_validator.py
 from __future__ import annotations
 
-import argparse
+import copy
+import heapq
+import json
+import os
+import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 import yaml
 
+if TYPE_CHECKING:  # argparse n'est importé qu'à la construction du parseur
+    import argparse
+
+try:  # libyaml (C) si disponible, sinon implémentations pure-Python
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # pragma: no cover - PyYAML sans libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+try:  # copies rapides des documents en cache (optionnel)
+    import orjson
+except ImportError:  # pragma: no cover - repli copy.deepcopy
+    orjson = None
+
+try:  # validation structurelle compilée (optionnelle)
+    import fastjsonschema
+except ImportError:  # pragma: no cover - contrôles Python seuls
+    fastjsonschema = None
+
 """
 ===============================================================================
 ARCHCode — agent_plan_validator (PHASE 2 : Validation d'ensemble)
@@ -26,6 +51,9 @@ Rôle (aligné avec le tiddler "Mapping réflexif" et le pipeline) :
         meta.comment_agent_plan_validator (synthèse des avertissements non bloquants)
   - Sinon :
       `.archcode/comment_agent_plan_validator.yaml` (diagnostic actionnable) et sortie non nulle.
+  - Format : `--artifact-format {yaml,json}` (ou ARCHCODE_ARTIFACT_FORMAT). Par défaut
+    plan_validated en YAML, commentaire (artefact machine) en JSON compact ; le JSON
+    étant du YAML valide, les noms de fichiers et les lecteurs YAML restent inchangés.
   - Option : mise à jour de l’EC (plan_validated_id).
 
 Zéro LLM, zéro réseau. Tout est déterministe.
@@ -52,17 +80,120 @@ def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+# Documents déjà parsés : chemin → (mtime_ns, taille, document, sérialisation orjson | None)
+_yaml_cache: Dict[str, Tuple[int, int, Dict[str, Any], Optional[bytes]]] = {}
+
+
+def clear_yaml_cache() -> None:
+    """Vide le cache des documents YAML parsés."""
+    _yaml_cache.clear()
+
+
+def _json_snapshot(data: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Sérialise `data` avec orjson si l'aller-retour est exact (types JSON purs).
+
+    None si orjson est absent ou si le document contient des types que JSON
+    ne restitue pas à l'identique (dates, tuples, ensembles, NaN…).
+    """
+    if orjson is None:
+        return None
+    try:
+        blob = orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        return None
+    return blob if orjson.loads(blob) == data else None
+
+
+def _copy_cached(data: Dict[str, Any], blob: Optional[bytes]) -> Dict[str, Any]:
+    """Copie profonde d'un document en cache (orjson.loads si possible)."""
+    return orjson.loads(blob) if blob is not None else copy.deepcopy(data)
+
+
 def _read_yaml(path: Path) -> Dict[str, Any]:
-    """Charge un fichier YAML en dictionnaire ({} si vide)."""
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return data or {}
+    """Charge un fichier YAML en dictionnaire ({} si vide).
+
+    Les octets sont passés tels quels au loader (décodage UTF-8 côté libyaml).
+    Un fichier inchangé (même mtime_ns et taille) n'est pas re-parsé ; une
+    copie profonde est renvoyée car les appelants peuvent modifier le document
+    (décodage orjson de l'instantané si disponible, sinon copy.deepcopy).
+    """
+    key = str(path)
+    st = path.stat()
+    hit = _yaml_cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return _copy_cached(hit[2], hit[3])
+    raw = path.read_bytes()
+    data = None
+    if raw.lstrip()[:1] == b"{":  # artefact JSON (sous-ensemble de YAML) → parseur C json
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None  # mapping YAML en style flow : repli sur le loader YAML
+    if data is None:
+        data = yaml.load(raw, Loader=_Loader)
+    data = data or {}
+    blob = _json_snapshot(data)
+    _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data, blob)
+    return _copy_cached(data, blob)
+
+
+def _write_bytes_atomic(data: bytes, path: Path) -> None:
+    """
+    Écrit `data` dans un fichier temporaire voisin (un fsync), puis le renomme
+    sur la cible (os.replace) : jamais de fichier tronqué en cas d'interruption.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Largeur d'émission : désactive le repli des longues chaînes (moins de travail par scalaire)
+_YAML_WIDTH = 10**6
 
 
 def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
-    """Écrit un dictionnaire dans un fichier YAML, en créant les répertoires si besoin."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(doc, f, sort_keys=False, allow_unicode=True)
+    """Écrit un dictionnaire dans un fichier YAML, en créant les répertoires si besoin.
+
+    Sérialisation complète en mémoire (sans repli de ligne) puis une seule écriture.
+    """
+    data = yaml.dump(
+        doc, Dumper=_Dumper, sort_keys=False, allow_unicode=True,
+        default_flow_style=False, width=_YAML_WIDTH,
+    ).encode("utf-8")
+    _write_bytes_atomic(data, path)
+
+
+# Formats d'artefacts : le JSON reste lisible par tout lecteur YAML
+ARTIFACT_FORMATS = ("yaml", "json")
+
+
+def _env_artifact_format() -> Optional[str]:
+    """Format imposé par ARCHCODE_ARTIFACT_FORMAT (None si absent ou invalide)."""
+    fmt = os.environ.get("ARCHCODE_ARTIFACT_FORMAT", "").strip().lower()
+    return fmt if fmt in ARTIFACT_FORMATS else None
+
+
+def _write_json(doc: Dict[str, Any], path: Path) -> None:
+    """Écrit un dictionnaire en JSON compact (une seule écriture)."""
+    data = json.dumps(doc, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    _write_bytes_atomic(data, path)
+
+
+def _write_artifact(doc: Dict[str, Any], path: Path, fmt: str) -> None:
+    """Écrit un artefact machine au format demandé ("yaml" | "json")."""
+    if fmt == "json":
+        _write_json(doc, path)
+    else:
+        _write_yaml(doc, path)
 
 
 def _gen_plan_validated_id() -> str:
@@ -70,6 +201,12 @@ def _gen_plan_validated_id() -> str:
     return f"PV-{uuid.uuid4().hex[:8]}"
 
 
+@lru_cache(maxsize=4096)
+def _norm(s: str) -> str:
+    """Normalise un jeton (strip) ; mémoïsé car noms de modules et I/O se répètent."""
+    return s.strip()
+
+
 def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
     """Déduplique une liste de chaînes en préservant l'ordre et en filtrant le vide."""
     if not values:
@@ -77,7 +214,7 @@ def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
     seen = set()
     out: List[str] = []
     for v in values:
-        s = str(v).strip()
+        s = _norm(str(v))
         if s and s not in seen:
             seen.add(s)
             out.append(s)
@@ -101,11 +238,30 @@ def _load_ec(ec_path: Path) -> Dict[str, Any]:
     return ec
 
 
+def _ensure_pga_compacted(pga_path: Path) -> None:
+    """
+    Refuse un PGA dont le journal d’ajouts (`<pga>.wal.yaml`, écrit par
+    `agent_module_compilator add`) n’a pas encore été replié : le YAML seul
+    serait incomplet. Lève ValueError si le journal existe et n’est pas vide.
+    """
+    wal = pga_path.with_suffix(".wal.yaml")
+    try:
+        pending = wal.stat().st_size > 0
+    except OSError:
+        return
+    if pending:
+        raise ValueError(
+            f"PGA non compacté : journal d’ajouts en attente ({wal}). "
+            "Lancez `agent_module_compilator compact` avant la validation."
+        )
+
+
 def _load_pga(pga_path: Path) -> Dict[str, Any]:
     """
     Charge le plan agrégé (PGA) et retourne la racine `plan_draft_aggregated`.
-    Lève ValueError si la clé racine est absente.
+    Lève ValueError si la clé racine est absente ou si un WAL reste à replier.
     """
+    _ensure_pga_compacted(pga_path)
     doc = _read_yaml(pga_path)
     root = doc.get("plan_draft_aggregated")
     if not isinstance(root, dict):
@@ -117,14 +273,57 @@ def _load_pga(pga_path: Path) -> Dict[str, Any]:
 # Validation — règles déterministes
 # -----------------------------------------------------------------------------
 
-def _index_user_stories(ec: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    """Construit un index id → user_story depuis EC.user_stories[]."""
-    idx: Dict[str, Dict[str, Any]] = {}
-    for us in ec.get("user_stories") or []:
-        uid = str(us.get("id") or "").strip()
-        if uid:
-            idx[uid] = us
-    return idx
+def _user_story_ids(ec: Dict[str, Any]) -> FrozenSet[str]:
+    """Ensemble des ids de EC.user_stories[] (seule l'appartenance est contrôlée)."""
+    return frozenset(
+        uid
+        for us in ec.get("user_stories") or []
+        if (uid := str(us.get("id") or "").strip())
+    )
+
+
+def _peek_pga_spec_version(pga_path: Path) -> Tuple[bool, Any]:
+    """
+    Lit `plan_draft_aggregated.spec_version_ref` via le flux d'événements YAML,
+    sans construire le document, et s'arrête dès la valeur trouvée.
+
+    Retourne (trouvé, valeur). (False, None) si la clé est absente, ailleurs
+    qu'au 2e niveau, portée par un tag explicite, ou si une clé complexe est
+    rencontrée (l'appelant fait alors le parsing complet).
+    """
+    # Pile des conteneurs ouverts : [est_mapping, prochain_noeud_est_clé, clé_courante]
+    stack: List[List[Any]] = []
+    with pga_path.open("rb") as f:
+        for ev in yaml.parse(f, Loader=_Loader):
+            is_start = isinstance(ev, yaml.CollectionStartEvent)
+            if is_start or isinstance(ev, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if stack and stack[-1][0]:
+                    frame = stack[-1]
+                    if frame[1]:
+                        if not isinstance(ev, yaml.ScalarEvent):
+                            return False, None  # clé complexe : parsing complet
+                        frame[1] = False
+                        frame[2] = ev.value
+                    else:
+                        frame[1] = True
+                        if (
+                            len(stack) == 2
+                            and stack[0][2] == "plan_draft_aggregated"
+                            and frame[2] == "spec_version_ref"
+                            and isinstance(ev, yaml.ScalarEvent)
+                        ):
+                            if not any(ev.implicit):
+                                return False, None  # tag explicite
+                            if ev.style in ("'", '"', "|", ">"):
+                                return True, ev.value  # scalaire cité ou bloc → str
+                            return True, yaml.load(ev.value, Loader=_Loader)  # résolution implicite
+                if is_start:
+                    stack.append([isinstance(ev, yaml.MappingStartEvent), True, None])
+            elif isinstance(ev, yaml.CollectionEndEvent):
+                stack.pop()
+                if len(stack) == 1 and stack[0][2] == "plan_draft_aggregated":
+                    return False, None  # fin du bloc PGA sans spec_version_ref
+    return False, None
 
 
 def _check_spec_version(root_pga: Dict[str, Any], ec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -144,6 +343,95 @@ def _check_spec_version(root_pga: Dict[str, Any], ec: Dict[str, Any]) -> Optiona
     return None
 
 
+# Contrat structurel d'un module_draft (files_expected / responsibilities).
+# Les messages d'erreur restent produits par les contrôles Python.
+MODULE_DRAFT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["files_expected", "responsibilities"],
+    "properties": {
+        "files_expected": {
+            "type": "array",
+            "minItems": 1,
+            "items": {"type": "string", "pattern": r"\S"},
+        },
+        "responsibilities": {"type": "array", "minItems": 1},
+    },
+}
+
+
+def _compile_module_schema() -> Optional[Any]:
+    """Compile MODULE_DRAFT_SCHEMA une fois (None si fastjsonschema absent)."""
+    if fastjsonschema is None:
+        return None
+    validate = fastjsonschema.compile(MODULE_DRAFT_SCHEMA)
+
+    def _is_valid(md: Dict[str, Any]) -> bool:
+        try:
+            validate(md)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return _is_valid
+
+
+_MD_SCHEMA_OK = _compile_module_schema()
+
+
+def _find_dependency_cycles(adj: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Retourne les cycles de dépendances (composantes fortement connexes de taille > 1).
+
+    Tarjan itératif (pile explicite, pas de limite de récursion) en O(V+E) ;
+    les arêtes vers des modules absents de `adj` sont ignorées.
+    """
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: List[str] = []
+    sccs: List[List[str]] = []
+    counter = 0
+
+    for start in adj:
+        if start in index:
+            continue
+        index[start] = low[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(adj[start]))]
+        while work:
+            node, succ = work[-1]
+            for nxt in succ:
+                if nxt not in adj:
+                    continue
+                if nxt not in index:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(adj[nxt])))
+                    break
+                if nxt in on_stack:
+                    low[node] = min(low[node], index[nxt])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    scc: List[str] = []
+                    while True:
+                        m = stack.pop()
+                        on_stack.discard(m)
+                        scc.append(m)
+                        if m == node:
+                            break
+                    if len(scc) > 1:
+                        sccs.append(scc[::-1])
+    return sccs
+
+
 def _validate_modules(
     root_pga: Dict[str, Any],
     ec: Dict[str, Any],
@@ -160,6 +448,7 @@ def _validate_modules(
       - user_story_id obligatoire et existant dans EC.user_stories
       - responsibilities[] non vide
       - depends_on : avertissement si référence non déclarée dans PGA.modules
+      - depends_on : erreur si cycle entre modules (composantes fortement connexes)
       - inputs/outputs : avertissement si hors du vocabulaire SpecBlock (si connu)
 
     Retour (pv_modules, errors, warnings).
@@ -167,20 +456,34 @@ def _validate_modules(
     items = root_pga.get("items") or []
     declared_modules = list(root_pga.get("modules") or [])
     declared_set = set(declared_modules)
+    order = {name: i for i, name in enumerate(declared_modules)}
     known_inputs = set(ec.get("input_sources") or [])
     known_outputs = set(ec.get("output_targets") or [])
-    us_index = _index_user_stories(ec)
+    us_ids = _user_story_ids(ec)
 
     pv_modules: List[Dict[str, Any]] = []
     errors: List[str] = []
     warnings: List[str] = []
 
     seen_names: set[str] = set()
+    # Clés de tri calculées à l'ajout ; le tri final est sauté si elles arrivent déjà croissantes
+    sort_keys: List[Tuple[int, str]] = []
+    already_sorted = True
 
     for it in items:
         md = it.get("module_draft") or {}
-        name = str(md.get("module_name") or "").strip()
-        status = str(it.get("status") or md.get("validator_status") or "").lower()
+        get = md.get
+        (
+            name_raw, validator_status, files_expected, user_story_raw, responsibilities,
+            depends_on_raw, inputs_raw, outputs_raw, tech_raw, meta,
+        ) = (
+            get("module_name"), get("validator_status"), get("files_expected"),
+            get("user_story_id"), get("responsibilities"), get("depends_on") or (),
+            get("inputs") or (), get("outputs") or (), get("technical_constraints") or (),
+            get("meta") or {},
+        )
+        name = str(name_raw or "").strip()
+        status = str(it.get("status") or validator_status or "").lower()
 
         # 1) Existence + unicité
         if not name:
@@ -204,58 +507,69 @@ def _validate_modules(
         if declared_set and name not in declared_set:
             warnings.append(f"Module '{name}' non listé dans PGA.modules (sera inclus).")
 
+        # Fast path : schéma compilé conforme → contrôles 4) et 6) déjà satisfaits
+        schema_ok = _MD_SCHEMA_OK is not None and _MD_SCHEMA_OK(md)
+
         # 4) files_expected : requis, non vide, str[]
-        files_expected = md.get("files_expected")
-        if not isinstance(files_expected, list) or not files_expected:
-            errors.append(f"Module '{name}': files_expected[] manquant ou vide.")
-            continue
-        if not all(isinstance(x, str) and x.strip() for x in files_expected):
-            errors.append(f"Module '{name}': files_expected[] doit être une liste de chaînes non vides.")
-            continue
+        if not schema_ok:
+            if not isinstance(files_expected, list) or not files_expected:
+                errors.append(f"Module '{name}': files_expected[] manquant ou vide.")
+                continue
+            if not all(isinstance(x, str) and x.strip() for x in files_expected):
+                errors.append(f"Module '{name}': files_expected[] doit être une liste de chaînes non vides.")
+                continue
 
         # 5) user_story_id mapping
-        user_story_id = str(md.get("user_story_id") or "").strip()
+        user_story_id = str(user_story_raw or "").strip()
         if not user_story_id:
             errors.append(f"Module '{name}': user_story_id manquant (contrat de mapping).")
             continue
-        if user_story_id not in us_index:
+        if user_story_id not in us_ids:
             errors.append(f"Module '{name}': user_story_id inconnu dans SpecBlock/EC ('{user_story_id}').")
             continue
 
         # 6) responsibilities
-        responsibilities = md.get("responsibilities")
-        if not isinstance(responsibilities, list) or len(responsibilities) == 0:
+        if not schema_ok and (not isinstance(responsibilities, list) or len(responsibilities) == 0):
             errors.append(f"Module '{name}': responsibilities[] vide (contrat de mapping).")
             continue
 
         # 7) depends_on (références inter-modules)
-        depends_on = [str(d).strip() for d in (md.get("depends_on") or []) if str(d).strip()]
-        for dep in depends_on:
-            if dep == name:
-                errors.append(f"Module '{name}': dépendance circulaire sur lui-même.")
-            elif declared_set and dep not in declared_set:
-                warnings.append(f"Module '{name}': dépendance '{dep}' non déclarée dans PGA.modules.")
+        depends_on = [ns for d in depends_on_raw if (ns := _norm(str(d)))]
+        if name in depends_on:
+            errors.append(f"Module '{name}': dépendance circulaire sur lui-même.")
+        if declared_set and depends_on:
+            unknown_deps = set(depends_on).difference(declared_set)
+            unknown_deps.discard(name)
+            if unknown_deps:
+                # ordre de déclaration conservé (artefact déterministe)
+                listed = [d for d in dict.fromkeys(depends_on) if d in unknown_deps]
+                warnings.append(f"Module '{name}': dépendances non déclarées dans PGA.modules : {listed}")
 
         # 8) I/O (si vocabulaire connu)
-        inputs = [str(x).strip() for x in (md.get("inputs") or []) if str(x).strip()]
-        outputs = [str(x).strip() for x in (md.get("outputs") or []) if str(x).strip()]
+        inputs = [ns for x in inputs_raw if (ns := _norm(str(x)))]
+        outputs = [ns for x in outputs_raw if (ns := _norm(str(x)))]
         if inputs and known_inputs:
-            unknown_in = [i for i in inputs if i not in known_inputs]
+            unknown_in = set(inputs).difference(known_inputs)
             if unknown_in:
-                warnings.append(f"Module '{name}': inputs inconnus vs SpecBlock : {unknown_in}")
+                listed = [i for i in inputs if i in unknown_in]
+                warnings.append(f"Module '{name}': inputs inconnus vs SpecBlock : {listed}")
         if outputs and known_outputs:
-            unknown_out = [o for o in outputs if o not in known_outputs]
+            unknown_out = set(outputs).difference(known_outputs)
             if unknown_out:
-                warnings.append(f"Module '{name}': outputs inconnus vs SpecBlock : {unknown_out}")
+                listed = [o for o in outputs if o in unknown_out]
+                warnings.append(f"Module '{name}': outputs inconnus vs SpecBlock : {listed}")
 
         # 9) Contraintes techniques (tolérance MVP)
-        tech = [str(x).strip() for x in (md.get("technical_constraints") or []) if str(x).strip()]
+        tech = [ns for x in tech_raw if (ns := _norm(str(x)))]
 
         # 10) Priority/meta éventuelle
-        meta = md.get("meta") or {}
         priority = meta.get("priority")
 
         # Construction item PV
+        key = (order.get(name, 10_000), name)
+        if sort_keys and key < sort_keys[-1]:
+            already_sorted = False
+        sort_keys.append(key)
         pv_modules.append({
             "module_name": name,
             "user_story_id": user_story_id,
@@ -268,6 +582,11 @@ def _validate_modules(
             "meta": {"priority": priority} if priority else {},
         })
 
+    # Cycles de dépendances inter-modules (les auto-dépendances sont signalées plus haut)
+    adj = {m["module_name"]: m["depends_on"] for m in pv_modules}
+    for scc in _find_dependency_cycles(adj):
+        errors.append(f"Cycle de dépendance entre modules: {scc}")
+
     # Avertir si des modules déclarés n'ont pas d'item correspondant
     if declared_set:
         missing = [m for m in declared_modules if m not in seen_names]
@@ -275,9 +594,9 @@ def _validate_modules(
             warnings.append(f"Modules déclarés sans draft agrégé: {missing}")
 
     # Ordonner PV.modules selon l’ordre PGA.modules, puis les autres
-    if declared_modules:
-        order = {name: i for i, name in enumerate(declared_modules)}
-        pv_modules.sort(key=lambda m: (order.get(m.get("module_name"), 10_000), m.get("module_name")))
+    if declared_modules and not already_sorted:
+        ranked = sorted(range(len(pv_modules)), key=sort_keys.__getitem__)
+        pv_modules = [pv_modules[i] for i in ranked]
 
     return pv_modules, errors, warnings
 
@@ -286,14 +605,43 @@ def _validate_modules(
 # Émission des artefacts
 # -----------------------------------------------------------------------------
 
-def _emit_comment(comment_path: Path, reasons: List[str], plan_diffs: List[Dict[str, Any]], *, ec: Dict[str, Any], pga: Dict[str, Any]) -> None:
+def _topological_order(pv_modules: List[Dict[str, Any]]) -> List[str]:
+    """
+    Ordre topologique des modules (dépendances d'abord), Kahn en O(V+E).
+
+    Égalités départagées par l'ordre de PV.modules ; dépendances hors plan
+    ignorées. Les cycles ayant été rejetés en amont, tous les modules sont listés.
+    """
+    names = [m["module_name"] for m in pv_modules]
+    rank = {n: i for i, n in enumerate(names)}
+    indegree = dict.fromkeys(names, 0)
+    dependents: Dict[str, List[str]] = {n: [] for n in names}
+    for m in pv_modules:
+        for dep in dict.fromkeys(m["depends_on"]):
+            if dep in rank and dep != m["module_name"]:
+                indegree[m["module_name"]] += 1
+                dependents[dep].append(m["module_name"])
+    ready = [rank[n] for n in names if indegree[n] == 0]
+    heapq.heapify(ready)
+    order: List[str] = []
+    while ready:
+        n = names[heapq.heappop(ready)]
+        order.append(n)
+        for d in dependents[n]:
+            indegree[d] -= 1
+            if indegree[d] == 0:
+                heapq.heappush(ready, rank[d])
+    return order
+
+
+def _emit_comment(comment_path: Path, reasons: List[str], plan_diffs: List[Dict[str, Any]], *, ec: Dict[str, Any], pga: Dict[str, Any], fmt: str = "json", now: Optional[str] = None) -> None:
     """
     Écrit un commentaire d'agent (bloquant) à destination du planner/compilator.
     Contient contexte de version pour faciliter la correction.
     """
     doc = {
         "comment_agent_plan_validator": {
-            "issued_at": _now_iso(),
+            "issued_at": now or _now_iso(),
             "bus_message_id": ec.get("bus_message_id"),
             "ec_spec_version": ec.get("spec_version"),
             "pga_spec_version_ref": pga.get("spec_version_ref"),
@@ -305,7 +653,7 @@ def _emit_comment(comment_path: Path, reasons: List[str], plan_diffs: List[Dict[
             ),
         }
     }
-    _write_yaml(doc, comment_path)
+    _write_artifact(doc, comment_path, fmt)
 
 
 def _emit_plan_validated(
@@ -317,11 +665,15 @@ def _emit_plan_validated(
     pv_modules: List[Dict[str, Any]],
     warnings: List[str],
     plan_diffs: List[Dict[str, Any]],
+    fmt: str = "yaml",
+    now: Optional[str] = None,
 ) -> None:
     """
     Écrit `plan_validated.yaml` avec synthèse des avertissements et diffs.
     Respecte la philosophie « SpecBlock ↔ PV ↔ EP » (référencement croisé).
+    Ajoute `indices` (module_name → position dans modules[], ordre topologique).
     """
+    now = now or _now_iso()
     pv = {
         "plan_validated": {
             "plan_validated_id": pv_id,
@@ -330,16 +682,21 @@ def _emit_plan_validated(
             "loop_iteration": int(ec.get("loop_iteration") or 0),
             "project_name": root_pga.get("project_name") or "project",
             "modules": pv_modules,
+            # Index précalculés : l'étape suivante évite de re-parcourir modules[]
+            "indices": {
+                "by_module_name": {m["module_name"]: i for i, m in enumerate(pv_modules)},
+                "topological_order": _topological_order(pv_modules),
+            },
             "meta": {
                 "comment_agent_plan_validator": "\n".join(warnings) if warnings else "",
-                "created_at": _now_iso(),
-                "validated_at": _now_iso(),
+                "created_at": now,
+                "validated_at": now,
             },
             # Exposé pour audit réflexif (PlanDiffBlock-like)
             "plan_diffs": plan_diffs,
         }
     }
-    _write_yaml(pv, out_path)
+    _write_artifact(pv, out_path, fmt)
 
 
 def _maybe_update_ec_with_pv_id(ec_path: Path, pv_id: str) -> None:
@@ -362,14 +719,43 @@ def cmd_validate(
     allow_pending: bool,
     allow_outdated_spec: bool,
     update_ec: bool,
+    artifact_format: Optional[str] = None,
 ) -> int:
     """
     Exécute la validation globale : succès → plan_validated.yaml, sinon commentaire bloquant.
 
+    `artifact_format` : force le format des deux artefacts ; par défaut le
+    plan validé reste en YAML et le commentaire (machine) est écrit en JSON.
+
     Retourne code 0 en cas de succès ; >0 si échec.
     """
-    ec = _load_ec(ec_path)
-    root_pga = _load_pga(pga_path)
+    pv_fmt = artifact_format or "yaml"
+    comment_fmt = artifact_format or "json"
+    now = _now_iso()  # un seul horodatage pour tous les artefacts de l'invocation
+
+    # 0) Chargements indépendants en parallèle (recouvrement des lectures disque) :
+    #    EC ∥ PGA complet si la version obsolète est tolérée ; sinon EC ∥ lecture
+    #    de l'en-tête PGA, pour rejeter tôt une version obsolète sans parser tout le PGA.
+    root_pga: Optional[Dict[str, Any]] = None
+    _ensure_pga_compacted(pga_path)  # avant la lecture d'en-tête : le WAL peut rafraîchir spec_version_ref
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        if allow_outdated_spec:
+            pga_fut = ex.submit(_load_pga, pga_path)
+            ec = _load_ec(ec_path)
+            root_pga = pga_fut.result()
+        else:
+            peek_fut = ex.submit(_peek_pga_spec_version, pga_path)
+            ec = _load_ec(ec_path)
+            found, pga_ver = peek_fut.result()
+
+    if root_pga is None:
+        head = {"spec_version_ref": pga_ver}
+        diff = _check_spec_version(head, ec) if found else None
+        if diff:
+            _emit_comment(comment_path, ["SpecBlock version mismatch (see plan_diffs)."], [diff], ec=ec, pga=head, fmt=comment_fmt, now=now)
+            print("[KO] spec_version_ref ≠ spec_version (bloquant).")
+            return 2
+        root_pga = _load_pga(pga_path)
 
     # 1) Diff de version Spec
     plan_diffs: List[Dict[str, Any]] = []
@@ -378,14 +764,14 @@ def cmd_validate(
         if allow_outdated_spec:
             plan_diffs.append(diff)
         else:
-            _emit_comment(comment_path, ["SpecBlock version mismatch (see plan_diffs)."], [diff], ec=ec, pga=root_pga)
+            _emit_comment(comment_path, ["SpecBlock version mismatch (see plan_diffs)."], [diff], ec=ec, pga=root_pga, fmt=comment_fmt, now=now)
             print("[KO] spec_version_ref ≠ spec_version (bloquant).")
             return 2
 
     # 2) Validation des modules
     pv_modules, errors, warnings = _validate_modules(root_pga, ec, allow_pending=allow_pending)
     if errors:
-        _emit_comment(comment_path, errors, plan_diffs, ec=ec, pga=root_pga)
+        _emit_comment(comment_path, errors, plan_diffs, ec=ec, pga=root_pga, fmt=comment_fmt, now=now)
         print(f"[KO] Validation échouée ({len(errors)} erreurs). Commentaire émis → {comment_path}")
         return 2
 
@@ -399,6 +785,8 @@ def cmd_validate(
         pv_modules=pv_modules,
         warnings=warnings,
         plan_diffs=plan_diffs,
+        fmt=pv_fmt,
+        now=now,
     )
     print(f"[OK] plan_validated.yaml émis → {out_path} (id={pv_id})")
 
@@ -430,8 +818,48 @@ def cmd_show(pv_path: Path) -> None:
     ]))
 
 
+_DEFAULT_EC = Path(".archcode") / "execution_context.yaml"
+_DEFAULT_PGA = Path(".archcode") / "plan_draft_aggregated.yaml"
+_DEFAULT_PV = Path(".archcode") / "plan_validated.yaml"
+_DEFAULT_COMMENT = Path(".archcode") / "comment_agent_plan_validator.yaml"
+
+# Drapeaux booléens de `validate` reconnus par l'analyse rapide
+_VALIDATE_FLAGS = {
+    "--allow-pending": "allow_pending",
+    "--allow-outdated-spec": "allow_outdated_spec",
+    "--update-ec": "update_ec",
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Analyse sans argparse l'invocation courante `validate [--drapeaux booléens]`.
+
+    Retourne None pour tout autre cas (options à valeur, --help, abréviations…),
+    traité alors par `_build_parser`.
+    """
+    if not argv or argv[0] != "validate" or any(a not in _VALIDATE_FLAGS for a in argv[1:]):
+        return None
+    args = SimpleNamespace(
+        cmd="validate",
+        ec=_DEFAULT_EC,
+        pga=_DEFAULT_PGA,
+        out=_DEFAULT_PV,
+        comment_out=_DEFAULT_COMMENT,
+        allow_pending=False,
+        allow_outdated_spec=False,
+        update_ec=False,
+        artifact_format=_env_artifact_format(),
+    )
+    for a in argv[1:]:
+        setattr(args, _VALIDATE_FLAGS[a], True)
+    return args
+
+
 def _build_parser() -> argparse.ArgumentParser:
-    """Construit le parseur CLI pour validate/show."""
+    """Construit le parseur CLI pour validate/show (import d'argparse différé)."""
+    import argparse
+
     p = argparse.ArgumentParser(
         prog="agent_plan_validator",
         description="ARCHCode — Valide le plan agrégé et produit plan_validated.yaml (déterministe).",
@@ -442,25 +870,25 @@ def _build_parser() -> argparse.ArgumentParser:
     sp_val.add_argument(
         "--ec",
         type=Path,
-        default=Path(".archcode") / "execution_context.yaml",
+        default=_DEFAULT_EC,
         help="Chemin de l'ExecutionContext",
     )
     sp_val.add_argument(
         "--pga",
         type=Path,
-        default=Path(".archcode") / "plan_draft_aggregated.yaml",
+        default=_DEFAULT_PGA,
         help="Chemin du plan agrégé",
     )
     sp_val.add_argument(
         "--out",
         type=Path,
-        default=Path(".archcode") / "plan_validated.yaml",
+        default=_DEFAULT_PV,
         help="Destination du plan validé",
     )
     sp_val.add_argument(
         "--comment-out",
         type=Path,
-        default=Path(".archcode") / "comment_agent_plan_validator.yaml",
+        default=_DEFAULT_COMMENT,
         help="Destination du commentaire bloquant en cas d'échec",
     )
     sp_val.add_argument(
@@ -479,12 +907,20 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Met à jour EC.plan_validated_id après succès",
     )
 
+    sp_val.add_argument(
+        "--artifact-format",
+        choices=ARTIFACT_FORMATS,
+        default=_env_artifact_format(),
+        help="Format des artefacts émis (défaut : plan_validated en yaml, commentaire en json ; "
+             "env ARCHCODE_ARTIFACT_FORMAT)",
+    )
+
     sp_show = sub.add_parser("show", help="Affiche un résumé d'un plan_validated.yaml")
     sp_show.add_argument(
         "pv_yaml",
         type=Path,
         nargs="?",
-        default=Path(".archcode") / "plan_validated.yaml",
+        default=_DEFAULT_PV,
         help="Chemin du plan validé",
     )
 
@@ -493,8 +929,9 @@ def _build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Optional[List[str]] = None) -> None:
     """Point d'entrée CLI : validate/show."""
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_parse(argv) or _build_parser().parse_args(argv)
 
     try:
         if args.cmd == "validate":
@@ -506,12 +943,13 @@ def main(argv: Optional[List[str]] = None) -> None:
                 allow_pending=args.allow_pending,
                 allow_outdated_spec=args.allow_outdated_spec,
                 update_ec=args.update_ec,
+                artifact_format=args.artifact_format,
             )
             raise SystemExit(code)
         elif args.cmd == "show":
             cmd_show(pv_path=args.pv_yaml)
         else:
-            parser.print_help()
+            _build_parser().print_help()
             raise SystemExit(1)
 
     except FileNotFoundError as e:
@@ -3,13 +3,29 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
+try:  # libyaml (C) si disponible, sinon implémentations pure-Python
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - PyYAML sans libyaml
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+try:  # miroir JSON de l'EC (optionnel)
+    import orjson
+except ImportError:  # pragma: no cover - pas de miroir, YAML seul
+    orjson = None
+
 """
 ===============================================================================
 ARCHCode — agent_project_planner (PHASE 2, Étape 1.5)
@@ -40,6 +56,8 @@ Utilisation :
       python -m agents.agent_project_planner planify ./.archcode/execution_context.yaml
   - Mettre à jour EC.project_name et EC.modules en même temps :
       python -m agents.agent_project_planner planify ./.archcode/execution_context.yaml --update-ec
+  - Planifier en lot tous les EC d'une arborescence (draft écrit à côté de chaque EC) :
+      python -m agents.agent_project_planner planify-batch ./projets --glob "**/execution_context.yaml"
   - Afficher un résumé du brouillon :
       python -m agents.agent_project_planner show ./.archcode/project_draft.yaml
 
@@ -56,13 +74,102 @@ def _now_iso() -> str:
     """
     Retourne l'horodatage ISO-8601 (secondes) pour tracer l'émission d'un artefact.
     """
-    return datetime.now().isoformat(timespec="seconds")
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+
+
+def _write_bytes_atomic(data: bytes, path: Path) -> None:
+    """
+    Écrit `data` dans un fichier temporaire voisin puis le renomme (os.replace).
+
+    Un lecteur concurrent (ex. un autre agent relisant l'EC pendant
+    `--update-ec`) ne voit jamais de fichier partiellement écrit.
+
+    Paramètres
+    ----------
+    data : bytes
+        Contenu complet du fichier.
+    path : Path
+        Destination (dossiers créés si besoin).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _json_mirror_path(path: Path) -> Path:
+    """
+    Chemin du miroir JSON d'un YAML (`execution_context.yaml.json`).
+    """
+    return path.with_name(path.name + ".json")
+
+
+def _json_snapshot(data: Any) -> Optional[bytes]:
+    """
+    Sérialise `data` avec orjson si l'aller-retour est exact (types JSON purs).
+
+    Retour
+    ------
+    Optional[bytes]
+        None si orjson est absent ou si le document contient des types que
+        JSON ne restitue pas à l'identique (dates, ensembles, NaN…).
+    """
+    if orjson is None:
+        return None
+    try:
+        blob = orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        return None
+    return blob if orjson.loads(blob) == data else None
+
+
+def _refresh_json_mirror(data: Any, path: Path, st: Optional[os.stat_result] = None) -> None:
+    """
+    Réécrit (ou supprime) le miroir JSON de `path` ; best-effort, jamais bloquant.
+
+    Le miroir enveloppe le document avec la signature du YAML source :
+    `{"src": [mtime_ns, taille], "doc": ...}`.
+
+    Paramètres
+    ----------
+    data : Any
+        Document YAML tel qu'il vient d'être lu ou écrit.
+    path : Path
+        Fichier YAML de référence.
+    st : Optional[os.stat_result]
+        Signature du YAML correspondant à `data` (relevée avant la lecture) ;
+        `path.stat()` si None (après une écriture).
+    """
+    if orjson is None:
+        return
+    mirror = _json_mirror_path(path)
+    blob = _json_snapshot(data)
+    try:
+        if blob is None:
+            mirror.unlink(missing_ok=True)
+            return
+        st = st or path.stat()
+        head = f'{{"src":[{st.st_mtime_ns},{st.st_size}],"doc":'.encode("ascii")
+        _write_bytes_atomic(head + blob + b"}", mirror)
+    except OSError:
+        pass
 
 
 def _read_yaml(path: Path) -> Dict[str, Any]:
     """
     Charge un fichier YAML en dictionnaire. Retourne {} si vide.
 
+    Les octets sont passés tels quels au loader (décodage UTF-8/BOM côté libyaml).
+    Si orjson est disponible et qu'un miroir `<nom>.yaml.json` porte exactement
+    la signature du YAML (mtime_ns et taille), son document est décodé à la
+    place du YAML. Sinon le YAML est parsé puis le miroir régénéré pour les
+    lectures suivantes (une copie restaurée avec un mtime plus ancien n'est
+    donc jamais masquée par un miroir périmé).
+
     Paramètres
     ----------
     path : Path
@@ -73,14 +180,73 @@ def _read_yaml(path: Path) -> Dict[str, Any]:
     Dict[str, Any]
         Contenu du YAML.
     """
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    st = path.stat()
+    if orjson is not None:
+        try:
+            env = orjson.loads(_json_mirror_path(path).read_bytes())
+            if isinstance(env, dict) and env.get("src") == [st.st_mtime_ns, st.st_size]:
+                return env.get("doc") or {}
+        except (OSError, orjson.JSONDecodeError):
+            pass
+    data = yaml.load(path.read_bytes(), Loader=_SafeLoader)
+    _refresh_json_mirror(data, path, st)
     return data or {}
 
 
+# Largeur de ligne de l'émetteur : assez grande pour ne jamais replier les chaînes.
+_YAML_WIDTH = 4096
+
+
+def _dump_yaml(doc: Dict[str, Any]) -> bytes:
+    """
+    Sérialise un dictionnaire en YAML UTF-8 (ordre des clés conservé, style
+    bloc explicite, pas de repli des longues chaînes).
+
+    Paramètres
+    ----------
+    doc : Dict[str, Any]
+        Document à sérialiser.
+
+    Retour
+    ------
+    bytes
+        Contenu YAML encodé.
+    """
+    return yaml.dump(
+        doc,
+        Dumper=_SafeDumper,
+        sort_keys=False,
+        allow_unicode=True,
+        default_flow_style=False,
+        width=_YAML_WIDTH,
+        encoding="utf-8",
+    )
+
+
+def _write_dumped(doc: Dict[str, Any], data: bytes, path: Path) -> None:
+    """
+    Écrit (atomiquement) un YAML déjà sérialisé par `_dump_yaml` et met à jour
+    son miroir JSON.
+
+    Paramètres
+    ----------
+    doc : Dict[str, Any]
+        Document d'origine (pour le miroir JSON).
+    data : bytes
+        Sortie de `_dump_yaml(doc)`.
+    path : Path
+        Destination (dossiers créés si besoin).
+    """
+    _write_bytes_atomic(data, path)
+    _refresh_json_mirror(doc, path)
+
+
 def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
     """
     Écrit un dictionnaire dans un fichier YAML (création de dossiers incluse).
 
+    Le miroir JSON éventuel est mis à jour dans la foulée.
+
     Paramètres
     ----------
     doc : Dict[str, Any]
@@ -88,9 +254,7 @@ def _write_yaml(doc: Dict[str, Any], path: Path) -> None:
     path : Path
         Destination.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(doc, f, sort_keys=False, allow_unicode=True)
+    _write_dumped(doc, _dump_yaml(doc), path)
 
 
 def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
@@ -109,14 +273,11 @@ def _dedup_str_list(values: Optional[List[str]]) -> List[str]:
     """
     if not values:
         return []
-    seen = set()
-    out: List[str] = []
-    for v in values:
-        s = str(v).strip()
-        if s and s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+    return list(dict.fromkeys(s for s in (str(v).strip() for v in values) if s))
+
+
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_SLUG_MULTI_US = re.compile(r"_{2,}")
 
 
 def _slugify_name(name: str) -> str:
@@ -133,9 +294,8 @@ def _slugify_name(name: str) -> str:
     str
         Slug snake_case (ASCII tolérant).
     """
-    s = name.lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_{2,}", "_", s).strip("_")
+    s = _SLUG_NONALNUM.sub("_", name.lower())
+    s = _SLUG_MULTI_US.sub("_", s).strip("_")
     return s or "project"
 
 
@@ -143,7 +303,28 @@ def _slugify_name(name: str) -> str:
 # Inférence déterministe (sans LLM) depuis l'ExecutionContext
 # -----------------------------------------------------------------------------
 
-_CANON_MODULES = ("core", "api", "auth", "ui_layer", "utils", "tests", "billing", "reports")
+_CANON_MODULES = tuple(
+    sys.intern(m) for m in ("core", "api", "auth", "ui_layer", "utils", "tests", "billing", "reports")
+)
+
+# Mot-clé (sous-chaîne, texte en minuscules) → module canonique.
+_KW_TO_MODULE: Dict[str, str] = {
+    **dict.fromkeys(("auth", "login", "token", "jwt", "sso", "identité"), "auth"),
+    **dict.fromkeys(("api", "endpoint", "route", "rest", "graphql"), "api"),
+    **dict.fromkeys(("ui", "interface", "web", "screen", "page"), "ui_layer"),
+    **dict.fromkeys(("pdf", "report", "rapport", "export pdf"), "reports"),
+    **dict.fromkeys(("billing", "payment", "paiement", "facturation"), "billing"),
+    **dict.fromkeys(("csv", "export", "import", "outil", "outils"), "utils"),
+}
+
+# Mots-clés regroupés par module (ordre de _KW_TO_MODULE) : chaque module est
+# testé par des recherches de sous-chaîne `k in txt` (C), arrêtées au premier
+# mot-clé trouvé.
+_MODULE_KWS: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (mod, tuple(k for k, m in _KW_TO_MODULE.items() if m == mod))
+    for mod in dict.fromkeys(_KW_TO_MODULE.values())
+)
+
 
 def _infer_modules_from_ec(ec: Dict[str, Any]) -> List[str]:
     """
@@ -168,35 +349,30 @@ def _infer_modules_from_ec(ec: Dict[str, Any]) -> List[str]:
     List[str]
         Liste ordonnée de modules canoniques.
     """
-    txt = " ".join([
-        " ".join(ec.get("functional_objectives") or []),
-        " ".join(ec.get("non_functional_constraints") or []),
-        str(ec.get("deployment_context") or ""),
-        " ".join([us.get("story", "") for us in (ec.get("user_stories") or [])]),
-    ]).lower()
+    parts = chain(
+        ec.get("functional_objectives") or (),
+        ec.get("non_functional_constraints") or (),
+        (str(ec.get("deployment_context") or ""),),
+        (us.get("story", "") for us in (ec.get("user_stories") or ())),
+    )
+    txt = " ".join(parts).lower()
 
     mods = {"core", "tests"}
-
-    def present(*keys: str) -> bool:
-        return any(k in txt for k in keys)
-
-    if present("auth", "login", "token", "jwt", "sso", "identité"):
-        mods.add("auth")
-    if present("api", "endpoint", "route", "rest", "graphql"):
-        mods.add("api")
-    if present("ui", "interface", "web", "screen", "page"):
-        mods.add("ui_layer")
-    if present("pdf", "report", "rapport", "export pdf"):
-        mods.add("reports")
-    if present("billing", "payment", "paiement", "facturation"):
-        mods.add("billing")
-    if present("csv", "export", "import", "outil", "outils"):
-        mods.add("utils")
+    contains = txt.__contains__
+    mods.update(mod for mod, kws in _MODULE_KWS if any(map(contains, kws)))
 
     ordered = [m for m in _CANON_MODULES if m in mods]
     return ordered
 
 
+# Table complète des liens possibles (univers fixe), dans l'ordre d'émission,
+# dédupliquée une fois pour toutes (« tests → core » figure dans les deux règles).
+_ALL_EDGES = tuple(dict.fromkeys(
+    [(m, "core") for m in _CANON_MODULES if m != "core"]
+    + [("tests", m) for m in ("api", "auth", "core")]
+))
+
+
 def _derive_dependencies(mods: List[str]) -> List[str]:
     """
     Déduit des dépendances simples sous forme 'A → B'.
@@ -211,16 +387,14 @@ def _derive_dependencies(mods: List[str]) -> List[str]:
     List[str]
         Liens de dépendance (sans doublon).
     """
-    links: List[str] = []
-    for m in mods:
-        if m in {"api", "auth", "ui_layer", "utils", "billing", "reports", "tests"}:
-            if "core" in mods and m != "core":
-                links.append(f"{m} → core")
-    if "tests" in mods:
-        for m in ("api", "auth", "core"):
-            if m in mods:
-                links.append(f"tests → {m}")
-    return _dedup_str_list(links)
+    ms = set(mods)
+    return [f"{a} → {b}" for a, b in _ALL_EDGES if a in ms and b in ms]
+
+
+# Priorité par module ; tout module absent de la table est 'basse'.
+_PRIORITY_TABLE: Dict[str, str] = {
+    sys.intern(k): v for k, v in {"auth": "haute", "api": "haute", "core": "moyenne"}.items()
+}
 
 
 def _derive_priority(mods: List[str]) -> Dict[str, str]:
@@ -237,15 +411,11 @@ def _derive_priority(mods: List[str]) -> Dict[str, str]:
     Dict[str, str]
         Mapping module → priorité.
     """
-    pr: Dict[str, str] = {}
-    for m in mods:
-        if m in {"auth", "api"}:
-            pr[m] = "haute"
-        elif m == "core":
-            pr[m] = "moyenne"
-        else:
-            pr[m] = "basse"
-    return pr
+    return {m: _PRIORITY_TABLE.get(m, "basse") for m in mods}
+
+
+# Contraintes sensibles (sécurité/données) imposant le mode 'strict'.
+_STRICT_RE = re.compile(r"rgpd|gdpr|hipaa|sécurité|security|pii", re.IGNORECASE)
 
 
 def _derive_validation_mode(ec: Dict[str, Any]) -> str:
@@ -262,10 +432,19 @@ def _derive_validation_mode(ec: Dict[str, Any]) -> str:
     str
         'strict' ou 'standard'.
     """
-    nfc = " ".join(ec.get("non_functional_constraints") or []).lower()
-    if any(k in nfc for k in ("rgpd", "gdpr", "hipaa", "sécurité", "security", "pii")):
-        return "strict"
-    return "standard"
+    nfc = " ".join(ec.get("non_functional_constraints") or ())
+    return "strict" if _STRICT_RE.search(nfc) else "standard"
+
+
+# Dossiers toujours présents (invariants, construits une seule fois).
+_BASE_STRUCTURE = (
+    {"name": "core/", "description": "Composants fonctionnels métier"},
+    {"name": "api/", "description": "Points d’entrée (routes, handlers)"},
+    {"name": "auth/", "description": "Identité, accès, tokens"},
+    {"name": "ui/", "description": "Interface (console/web)"},
+    {"name": "utils/", "description": "Helpers et fonctions transverses"},
+    {"name": "tests/", "description": "Tests unitaires et intégration"},
+)
 
 
 def _derive_folder_structure(mods: List[str]) -> Dict[str, Any]:
@@ -280,16 +459,10 @@ def _derive_folder_structure(mods: List[str]) -> Dict[str, Any]:
     Retour
     ------
     Dict[str, Any]
-        Structure de dossiers attendue.
-    """
-    structure = [
-        {"name": "core/", "description": "Composants fonctionnels métier"},
-        {"name": "api/", "description": "Points d’entrée (routes, handlers)"},
-        {"name": "auth/", "description": "Identité, accès, tokens"},
-        {"name": "ui/", "description": "Interface (console/web)"},
-        {"name": "utils/", "description": "Helpers et fonctions transverses"},
-        {"name": "tests/", "description": "Tests unitaires et intégration"},
-    ]
+        Structure de dossiers attendue (les entrées de base sont partagées
+        avec `_BASE_STRUCTURE` : ne pas les modifier en place).
+    """
+    structure = list(_BASE_STRUCTURE)
     if "billing" in mods:
         structure.append({"name": "billing/", "description": "Facturation, paiements"})
     if "reports" in mods:
@@ -301,6 +474,10 @@ def _derive_folder_structure(mods: List[str]) -> Dict[str, Any]:
 # Cœur agent : construction du project_draft
 # -----------------------------------------------------------------------------
 
+_EC_REQUIRED = ("bus_message_id", "title", "functional_objectives")
+_EC_GET = itemgetter(*_EC_REQUIRED)
+
+
 def _validate_ec_minimum(ec: Dict[str, Any]) -> None:
     """
     Vérifie la présence des champs EC requis pour planifier.
@@ -314,12 +491,50 @@ def _validate_ec_minimum(ec: Dict[str, Any]) -> None:
     ----------
     ValueError si des champs clés sont absents.
     """
-    required = ("bus_message_id", "title", "functional_objectives")
-    missing = [k for k in required if k not in ec or ec.get(k) in (None, "", [])]
+    try:
+        vals = _EC_GET(ec)
+    except KeyError:
+        # Chemin lent (au moins une clé absente) : lister toutes les manquantes.
+        vals = tuple(ec.get(k) for k in _EC_REQUIRED)
+    missing = [k for k, v in zip(_EC_REQUIRED, vals) if v in (None, "", [])]
     if missing:
         raise ValueError(f"ExecutionContext incomplet : champs manquants {missing}")
 
 
+def _read_yaml_header(path: Path, max_bytes: int = 4096) -> Tuple[Dict[str, Any], bool]:
+    """
+    Lit l'en-tête de l'EC (au plus `max_bytes` octets) pour la validation minimale.
+
+    Le préfixe est coupé à la dernière fin de ligne puis parsé. S'il contient
+    les champs requis non vides, il suffit à valider ; sinon (ou si le préfixe
+    n'est pas un mapping YAML valide) on retombe sur `_read_yaml` complet.
+
+    Paramètres
+    ----------
+    path : Path
+        Chemin de l'ExecutionContext.
+    max_bytes : int
+        Taille maximale du préfixe lu.
+
+    Retour
+    ------
+    (doc, complete) : Tuple[Dict[str, Any], bool]
+        complete = True si `doc` est l'EC entier (réutilisable tel quel).
+    """
+    if path.stat().st_size <= max_bytes:
+        return _read_yaml(path), True
+    with path.open("rb") as f:
+        head = f.read(max_bytes)
+    head = head[: head.rfind(b"\n") + 1]
+    try:
+        doc = yaml.load(head, Loader=_SafeLoader)
+    except yaml.YAMLError:
+        doc = None
+    if isinstance(doc, dict) and all(doc.get(k) not in (None, "", []) for k in _EC_REQUIRED):
+        return doc, False
+    return _read_yaml(path), True
+
+
 def build_project_draft(ec: Dict[str, Any]) -> Dict[str, Any]:
     """
     Construit le dictionnaire `project_draft` depuis l'EC (sans LLM).
@@ -336,29 +551,21 @@ def build_project_draft(ec: Dict[str, Any]) -> Dict[str, Any]:
     """
     _validate_ec_minimum(ec)
     title = str(ec.get("title") or "Projet")
-    project_name = _slugify_name(title)
-    objs = _dedup_str_list(ec.get("functional_objectives"))
     mods = _infer_modules_from_ec(ec)
-    deps = _derive_dependencies(mods)
-    prio = _derive_priority(mods)
-    vmode = _derive_validation_mode(ec)
-    folders = _derive_folder_structure(mods)
-
-    pd: Dict[str, Any] = {
+    return {
         "project_draft": {
-            "project_name": project_name,
-            "global_objectives": objs,
+            "project_name": _slugify_name(title),
+            "global_objectives": _dedup_str_list(ec.get("functional_objectives")),
             "initial_modules": mods,
-            "dependencies": deps,
-            "priority_map": prio,
-            "validation_mode": vmode,
-            "folder_structure": folders,
+            "dependencies": _derive_dependencies(mods),
+            "priority_map": _derive_priority(mods),
+            "validation_mode": _derive_validation_mode(ec),
+            "folder_structure": _derive_folder_structure(mods),
             "issued_at": _now_iso(),
             "bus_message_id": ec.get("bus_message_id"),
             "spec_version_ref": ec.get("spec_version"),
         }
     }
-    return pd
 
 
 # -----------------------------------------------------------------------------
@@ -367,7 +574,7 @@ def build_project_draft(ec: Dict[str, Any]) -> Dict[str, Any]:
 
 def _build_parser() -> argparse.ArgumentParser:
     """
-    Construit le parseur d'arguments de l'agent (planify/show).
+    Construit le parseur d'arguments de l'agent (planify/planify-batch/show).
 
     Retour
     ------
@@ -394,13 +601,34 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Met à jour EC.project_name et EC.modules d'après le draft",
     )
 
+    sp_batch = sub.add_parser(
+        "planify-batch",
+        help="Génère un project_draft.yaml à côté de chaque EC trouvé sous un dossier",
+    )
+    sp_batch.add_argument("root", type=Path, help="Dossier racine du scan")
+    sp_batch.add_argument(
+        "--glob",
+        default="**/execution_context.yaml",
+        help="Motif des EC relatif à la racine (défaut: **/execution_context.yaml)",
+    )
+    sp_batch.add_argument(
+        "--update-ec",
+        action="store_true",
+        help="Met à jour EC.project_name et EC.modules d'après chaque draft",
+    )
+
     sp_show = sub.add_parser("show", help="Affiche un résumé d'un project_draft.yaml")
     sp_show.add_argument("pd_yaml", type=Path, help="Chemin vers .archcode/project_draft.yaml")
 
     return p
 
 
-def cmd_planify(ec_yaml: Path, out: Path, update_ec: bool) -> None:
+def cmd_planify(
+    ec_yaml: Path,
+    out: Path,
+    update_ec: bool,
+    log: Callable[[str], None] = print,
+) -> None:
     """
     Construit et écrit `project_draft.yaml` ; met à jour EC si demandé.
 
@@ -412,17 +640,102 @@ def cmd_planify(ec_yaml: Path, out: Path, update_ec: bool) -> None:
         Fichier de sortie project_draft.
     update_ec : bool
         Si True, reflète `project_name` et `modules` dans l'EC.
+    log : Callable[[str], None]
+        Sortie des messages (print par défaut ; collecteur en mode lot).
     """
-    ec = _read_yaml(ec_yaml)
+    ec, complete = _read_yaml_header(ec_yaml)
+    _validate_ec_minimum(ec)
+    if not complete:
+        ec = _read_yaml(ec_yaml)
     draft = build_project_draft(ec)
-    _write_yaml(draft, out)
-    print(f"[OK] project_draft écrit → {out}")
 
+    # Sérialisations d'abord, écritures ensuite (l'EC n'est réécrit que s'il change).
+    ec_data: Optional[bytes] = None
     if update_ec:
-        ec["project_name"] = draft["project_draft"]["project_name"]
-        ec["modules"] = list(draft["project_draft"]["initial_modules"])
-        _write_yaml(ec, ec_yaml)
-        print("[OK] EC mis à jour (project_name, modules).")
+        new_name = draft["project_draft"]["project_name"]
+        new_mods = list(draft["project_draft"]["initial_modules"])
+        if ec.get("project_name") != new_name or ec.get("modules") != new_mods:
+            ec["project_name"] = new_name
+            ec["modules"] = new_mods
+            ec_data = _dump_yaml(ec)
+    draft_data = _dump_yaml(draft)
+
+    _write_dumped(draft, draft_data, out)
+    log(f"[OK] project_draft écrit → {out}")
+
+    if ec_data is not None:
+        _write_dumped(ec, ec_data, ec_yaml)
+        log("[OK] EC mis à jour (project_name, modules).")
+    elif update_ec:
+        log("[OK] EC déjà à jour (project_name, modules) — non réécrit.")
+
+
+def _planify_worker(ec_yaml: Path, *, update_ec: bool) -> Tuple[bool, List[str]]:
+    """
+    Unité de travail de `cmd_planify_batch` (picklable) : (succès, messages).
+
+    Le project_draft est écrit à côté de l'EC (`<dossier EC>/project_draft.yaml`).
+    """
+    lines: List[str] = []
+    try:
+        cmd_planify(ec_yaml, ec_yaml.parent / "project_draft.yaml", update_ec, log=lines.append)
+        return True, lines
+    except Exception as e:  # un EC invalide ne doit pas interrompre le lot
+        lines.append(f"[ERREUR] {ec_yaml}: {e}")
+        return False, lines
+
+
+# En deçà, le coût de démarrage des processus dépasse le gain
+_PARALLEL_MIN_FILES = 8
+
+
+def cmd_planify_batch(root: Path, pattern: str, update_ec: bool) -> int:
+    """
+    Planifie en un seul processus tous les EC trouvés sous `root`.
+
+    Import de PyYAML, compilation des regex et tables de modules sont payés une
+    fois pour tout le lot ; au-delà de `_PARALLEL_MIN_FILES` fichiers, les EC
+    (indépendants) sont traités en parallèle (processus), messages restitués
+    dans l'ordre des fichiers.
+
+    Paramètres
+    ----------
+    root : Path
+        Dossier racine du scan.
+    pattern : str
+        Motif glob relatif à `root` (ex. "**/execution_context.yaml").
+    update_ec : bool
+        Si True, reflète `project_name` et `modules` dans chaque EC.
+
+    Retour
+    ------
+    int
+        Nombre d'EC en échec.
+    """
+    files = sorted(p for p in root.glob(pattern) if p.is_file())
+    if not files:
+        print(f"[INFO] Aucun EC trouvé ({root}/{pattern}).")
+        return 0
+
+    work = partial(_planify_worker, update_ec=update_ec)
+    workers = min(os.cpu_count() or 1, len(files))
+    if workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(work, files))
+    else:
+        results = [work(f) for f in files]
+
+    failed = 0
+    for ok, lines in results:
+        for line in lines:
+            print(line)
+        failed += not ok
+
+    print("\n— Résultat global —")
+    print(f"  total   : {len(files)}")
+    print(f"  ok      : {len(files) - failed}")
+    print(f"  erreurs : {failed}")
+    return failed
 
 
 def cmd_show(pd_yaml: Path) -> None:
@@ -451,7 +764,7 @@ def cmd_show(pd_yaml: Path) -> None:
 
 def main(argv: Optional[List[str]] = None) -> None:
     """
-    Point d'entrée CLI : planify/show.
+    Point d'entrée CLI : planify/planify-batch/show.
     """
     parser = _build_parser()
     args = parser.parse_args(argv)
@@ -459,6 +772,9 @@ def main(argv: Optional[List[str]] = None) -> None:
     try:
         if args.cmd == "planify":
             cmd_planify(ec_yaml=args.ec_yaml, out=args.out, update_ec=args.update_ec)
+        elif args.cmd == "planify-batch":
+            if cmd_planify_batch(root=args.root, pattern=args.glob, update_ec=args.update_ec):
+                raise SystemExit(2)
         elif args.cmd == "show":
             cmd_show(pd_yaml=args.pd_yaml)
         else:
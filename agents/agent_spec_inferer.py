@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import os
 import argparse
+import copy
+import functools
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple
 
 from core.context import (
     load_bus_message,
@@ -63,9 +65,40 @@ def _env_enabled() -> bool:
 SPEC_INFERER_ENABLED: bool = _env_enabled()
 
 
-def agent_spec_inferer(bus_message_path: Path, *, persist: bool = False) -> SpecBlock:
+@functools.lru_cache(maxsize=64)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> SpecBlock:
     """
-    Point d’entrée bouchon de l’agent d’inférence.
+    Charge un bus_message en mémorisant le SpecBlock par (chemin, mtime_ns, taille).
+
+    La clé inclut la signature du fichier : toute modification sur disque
+    provoque un nouveau chargement. L'objet renvoyé est partagé : le copier
+    avant toute mutation.
+    """
+    return load_bus_message(Path(path_str), auto_fill=True)
+
+
+def _load_spec(bus_message_path: Path) -> SpecBlock:
+    """
+    Retourne une copie privée du SpecBlock (via le cache `_load_cached`).
+
+    Paramètres
+    ----------
+    bus_message_path : Path
+        Chemin du fichier `bus_message.yaml`.
+
+    Retour
+    ------
+    SpecBlock
+        Copie profonde, modifiable sans affecter le cache.
+    """
+    st = bus_message_path.stat()
+    cached = _load_cached(str(bus_message_path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(cached)
+
+
+def _annotate_disabled(bus_message_path: Path, *, persist: bool = False) -> Tuple[SpecBlock, bool]:
+    """
+    Annote le bus_message avec le statut 'disabled' (corps de `_agent_disabled`).
 
     Paramètres
     ----------
@@ -76,25 +109,18 @@ def agent_spec_inferer(bus_message_path: Path, *, persist: bool = False) -> Spec
 
     Retour
     ------
-    SpecBlock
-        Spécification rechargée telle quelle (no-op), éventuellement annotée.
+    (spec, applied) : Tuple[SpecBlock, bool]
+        Spécification rechargée, éventuellement annotée ; applied = False si
+        la note identique était déjà présente (no-op, rien n’est réécrit).
 
     Comportement
     ------------
-    - Si SPEC_INFERER_ENABLED est False (MVP) :
-        * charge et renvoie le SpecBlock
-        * ajoute une note interne sous free_field_2.agent_spec_inferer
-          (status="disabled") ; persist si demandé.
-    - Si SPEC_INFERER_ENABLED est True :
-        * lève NotImplementedError pour garantir qu’aucune logique IA ne tourne.
+    - charge le SpecBlock et ajoute une note interne sous
+      free_field_2.agent_spec_inferer (status="disabled") ; persist si demandé.
+    - si la note identique est déjà présente : retour immédiat
+      (aucune réécriture, même avec persist=True).
     """
-    spec: SpecBlock = load_bus_message(bus_message_path, auto_fill=True)
-
-    if SPEC_INFERER_ENABLED:
-        raise NotImplementedError(
-            "agent_spec_inferer est marqué 'enabled' mais l’implémentation IA "
-            "est volontairement absente en MVP (pas de RAG/embeddings)."
-        )
+    spec: SpecBlock = _load_spec(bus_message_path)
 
     # Annotation interne (non destructive) pour tracer le refus contrôlé
     note: Dict[str, Any] = {
@@ -103,14 +129,53 @@ def agent_spec_inferer(bus_message_path: Path, *, persist: bool = False) -> Spec
         "reason": "Prototype MVP — mode assisté non implémenté (pas de RAG/LLM).",
     }
     current_ff2 = spec.free_field_2 if isinstance(spec.free_field_2, dict) else {}
+    if current_ff2.get("agent_spec_inferer") == note:
+        # Déjà annoté à l'identique : ni enrichissement ni réécriture.
+        return spec, False
     merged = dict(current_ff2)
     merged["agent_spec_inferer"] = note
     spec = enrich_with_internal_annotations(spec, {"free_field_2": merged})
 
     if persist:
         save_bus_message(spec, bus_message_path)
+        # mtime à granularité grossière (FAT, certains montages) : ne pas
+        # risquer de resservir la version pré-annotation.
+        _load_cached.cache_clear()
+
+    return spec, True
+
+
+def _agent_disabled(bus_message_path: Path, *, persist: bool = False) -> SpecBlock:
+    """
+    Point d’entrée bouchon de l’agent d’inférence (publié sous
+    `agent_spec_inferer` quand SPEC_INFERER_ENABLED est False) : voir
+    `_annotate_disabled`.
+    """
+    return _annotate_disabled(bus_message_path, persist=persist)[0]
 
-    return spec
+
+def _agent_enabled(bus_message_path: Path, *, persist: bool = False) -> SpecBlock:
+    """
+    Variante publiée quand SPEC_INFERER_ENABLED est True : charge le bus_message
+    (erreurs d’accès inchangées) puis lève NotImplementedError pour garantir
+    qu’aucune logique IA ne tourne.
+    """
+    _load_spec(bus_message_path)
+    raise NotImplementedError(
+        "agent_spec_inferer est marqué 'enabled' mais l’implémentation IA "
+        "est volontairement absente en MVP (pas de RAG/embeddings)."
+    )
+
+
+# La bascule est figée à l’import : on publie directement la bonne variante
+# plutôt que de tester SPEC_INFERER_ENABLED à chaque appel.
+agent_spec_inferer: Callable[..., SpecBlock] = (
+    _agent_enabled if SPEC_INFERER_ENABLED else _agent_disabled
+)
+# Variante CLI rapportant aussi si l’annotation a été appliquée (False = no-op).
+_annotate: Callable[..., Tuple[SpecBlock, bool]] = (
+    _agent_enabled if SPEC_INFERER_ENABLED else _annotate_disabled  # type: ignore[assignment]
+)
 
 
 def get_status() -> Tuple[bool, str]:
@@ -193,9 +258,12 @@ def _cmd_annotate(bus_message: Path, persist: bool) -> int:
     Retour
     ------
     int
-        Code de sortie (0 si OK).
+        Code de sortie (0 si OK, y compris si déjà annoté).
     """
-    _ = agent_spec_inferer(bus_message, persist=persist)
+    _, applied = _annotate(bus_message, persist=persist)
+    if not applied:
+        print("[agent_spec_inferer] Annotation 'disabled' déjà présente (déjà annoté, rien à réécrire).")
+        return 0
     print(f"[agent_spec_inferer] Annotation 'disabled' appliquée ({'persistée' if persist else 'non persistée'}).")
     return 0
 
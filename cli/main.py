@@ -1,6 +1,8 @@
 # cli/main.py
 from __future__ import annotations
 
+import copy
+import functools
 import sys
 import subprocess
 from datetime import datetime
@@ -9,12 +11,13 @@ from typing import Dict, List, Tuple
 
 import typer
 
-from core.yaml_io import load_execution_plan
+from core.archiver import flush_all as flush_archive_index
+from core.yaml_io import ExecutionPlan, load_execution_plan
 from core.types import PlanLine
-from agents.acwp import build_prompt
-from agents.acw import run_acw
+from agents.acwp import build_prompts
+from agents.acw import run_acw_batch
 from agents.agent_file_checker import check_file
-from agents.agent_module_checker import check_module
+from agents.agent_module_checker import check_modules
 
 # Runner (écritures + git + archivage)
 from runner.run_plan import run_plan
@@ -122,6 +125,24 @@ def _validate_plan_line_dict(pl: Dict) -> List[str]:
     return errs
 
 
+@functools.lru_cache(maxsize=32)
+def _load_ep_cached(path_str: str, mtime_ns: int, size: int) -> ExecutionPlan:
+    """Parse + valide un execution_plan, mémorisé par (chemin, mtime_ns, taille)."""
+    return load_execution_plan(Path(path_str))
+
+
+def _load_ep(ep: Path) -> ExecutionPlan:
+    """
+    Charge un execution_plan via le cache `_load_ep_cached` (copie privée).
+    Un fichier modifié sur disque change la clé et est donc re-parsé.
+    """
+    try:
+        st = ep.stat()
+    except OSError:
+        return load_execution_plan(ep)  # message d'erreur natif du chargeur
+    return copy.deepcopy(_load_ep_cached(str(ep), st.st_mtime_ns, st.st_size))
+
+
 def _summary_counts(ep) -> Tuple[int, int]:
     """Retourne un résumé `(nb_modules, nb_plan_lines)` pour un execution_plan parsé."""
     modules = len(ep.modules or [])
@@ -164,7 +185,7 @@ def cmd_validate_ep(
     Code retour ≠ 0 si erreurs.
     """
     try:
-        ep_obj = load_execution_plan(ep)
+        ep_obj = _load_ep(ep)
     except Exception as e:
         typer.secho(f"[validate-ep] YAML invalide: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=2)
@@ -205,7 +226,7 @@ def cmd_dry_run(
     Affiche un petit rapport et retourne code ≠ 0 si une PlanLine échoue.
     """
     try:
-        ep_obj = load_execution_plan(ep)
+        ep_obj = _load_ep(ep)
     except Exception as e:
         typer.secho(f"[dry-run] YAML invalide: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=2)
@@ -213,18 +234,18 @@ def cmd_dry_run(
     ok_count = 0
     rej_count = 0
 
+    # Chaque étape est appliquée au lot d'un module (contexte global ACW chargé
+    # une fois par module) ; l'en-tête du module est affiché avant traitement.
     for mod in (ep_obj.modules or []):
         module_name = mod.get("module", "unknown")
-        plan_lines = mod.get("plan_lines", [])
-        typer.secho(f"→ Module {module_name} ({len(plan_lines)} plan_lines)", fg=typer.colors.BLUE)
+        group = [PlanLine(**pld) for pld in mod.get("plan_lines", [])]
+        typer.secho(f"→ Module {module_name} ({len(group)} plan_lines)", fg=typer.colors.BLUE)
+
+        pbs = run_acw_batch(group, build_prompts(group))
+        pbs = check_modules([check_file(pb) for pb in pbs])
 
-        for pld in plan_lines:
-            pl = PlanLine(**pld)
+        for pl, pb in zip(group, pbs):
             typer.echo(f"  • {pl.plan_line_id} → {pl.file}")
-            prompt = build_prompt(pl)
-            pb = run_acw(pl, prompt)
-            pb = check_file(pb)
-            pb = check_module(pb)
             status = pb.global_status or "pending"
             if status == "ok":
                 ok_count += 1
@@ -261,6 +282,9 @@ def cmd_run(
     except Exception as e:
         typer.secho(f"[run] échec: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
+    finally:
+        # index.yaml des runs : entrées bufferisées, écrites d'un bloc en fin de run
+        flush_archive_index()
 
 
 # --- commands (gouvernance Git) ------------------------------
@@ -17,7 +17,10 @@ Ce module écrit dans: .arch_runs/<run_id>/
   - decision.yaml               (résumé de la décision)
   - console.log                 (append)
   - .run.kv                     (métadonnées de run en KV simple: key=value)
-  - index.yaml                  (tiny index ordonné des artefacts produits)
+  - index.yaml                  (tiny index ordonné des artefacts produits,
+                                 écrit d’un bloc par `flush_index` en fin de
+                                 run — runner/orchestrator — ; `flush_all`
+                                 via atexit sert de filet de sécurité)
 
 Notes:
 - Aucun parse YAML n’est requis ici; on fournit un mini *émetteur* YAML robuste
@@ -26,25 +29,49 @@ Notes:
   fonctions d’archivage.
 """
 
+import atexit
+import os
+import re
+import time
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, List, Mapping, Tuple
 
 
 # ---------- utilitaires basiques ----------
 
+_TS_CACHE: Tuple[int, str] = (0, "")
+
+
 def _now_iso() -> str:
-    """Retourne la date/heure locale au format ISO (secondes)."""
-    return datetime.now().isoformat(timespec="seconds")
+    """
+    Retourne la date/heure locale au format ISO (secondes).
+
+    La chaîne est mémorisée pour la seconde courante : les appels successifs
+    d’une même boucle d’archivage ne refont ni `datetime` ni `isoformat()`.
+    """
+    global _TS_CACHE
+    t = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] == t:
+        return cached[1]
+    s = datetime.fromtimestamp(t).isoformat(timespec="seconds")
+    _TS_CACHE = (t, s)
+    return s
+
 
+def _ensure_dir_str(root: str | Path) -> str:
+    """
+    Crée le dossier `root` s’il n’existe pas et renvoie son chemin normalisé (str).
 
-def _ensure_dir(root: str | Path) -> Path:
-    """Crée le dossier `root` s’il n’existe pas et renvoie son Path."""
-    p = Path(root)
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    Chemins manipulés en str dans les écritures d’archive (pas de Path par
+    artefact) ; `Path` n’est construit qu’en valeur de retour publique.
+    """
+    s = os.path.normpath(os.fspath(root))
+    os.makedirs(s, exist_ok=True)
+    return s
 
 
 def _meta_to_dict(meta: Any) -> Dict[str, Any]:
@@ -55,7 +82,11 @@ def _meta_to_dict(meta: Any) -> Dict[str, Any]:
         return asdict(meta)
     if isinstance(meta, SimpleNamespace):
         return vars(meta).copy()
-    # Duck-typing: récupère attributs publics non callables
+    # Objet ordinaire : attributs d’instance publics non callables (sans dir())
+    d = getattr(meta, "__dict__", None)
+    if d is not None:
+        return {k: v for k, v in d.items() if not k.startswith("_") and not callable(v)}
+    # Dernier recours (objet à __slots__) : duck-typing via dir()
     out: Dict[str, Any] = {}
     for k in dir(meta):
         if k.startswith("_"):
@@ -106,10 +137,12 @@ def decision_to_mapping(decision: Any) -> Dict[str, Any]:
 
 # ---------- mini-émetteur YAML (zéro dépendance) ----------
 
+_SIMPLE_SCALAR_MATCH = re.compile(r"[A-Za-z0-9._/+-]+").fullmatch
+
+
 def _is_simple_scalar(s: str) -> bool:
     """Indique si `s` peut être émis sans guillemets (alnum + ponctuation sûre)."""
-    import re
-    return bool(re.fullmatch(r"[A-Za-z0-9._/+-]+", s))
+    return _SIMPLE_SCALAR_MATCH(s) is not None
 
 
 def _yaml_escape(s: str) -> str:
@@ -134,95 +167,149 @@ def _emit_scalar(value: Any) -> str:
     return _yaml_escape(s)
 
 
-def _yamlify(obj: Any, indent: int = 0) -> str:
-    """Sérialise un objet Python (mapping/list/scalaire) en YAML minimaliste."""
+def _yamlify(obj: Any, indent: int, out: list[str], sort_keys: bool = False) -> None:
+    """
+    Sérialise un objet Python (mapping/list/scalaire) en YAML minimaliste, ligne à ligne dans `out`.
+
+    Les mappings construits ici ont déjà un ordre canonique (ordre d’insertion) :
+    le tri des clés n’est fait que sur demande (`sort_keys=True`).
+    """
     pad = " " * indent
     if isinstance(obj, Mapping):
-        lines: list[str] = []
-        # tri des clés pour stabilité
-        for k in sorted(obj.keys(), key=lambda x: str(x)):
+        if not obj:
+            out.append(f"{pad}{{}}")
+            return
+        item_pad = pad + "  -"
+        keys = sorted(obj.keys(), key=str) if sort_keys else obj.keys()
+        for k in keys:
             v = obj[k]
             key = str(k)
             if isinstance(v, Mapping):
-                lines.append(f"{pad}{key}:")
-                lines.append(_yamlify(v, indent + 2))
+                out.append(f"{pad}{key}:")
+                _yamlify(v, indent + 2, out, sort_keys)
             elif isinstance(v, (list, tuple)):
                 if len(v) == 0:
-                    lines.append(f"{pad}{key}: []")
+                    out.append(f"{pad}{key}: []")
                 else:
-                    lines.append(f"{pad}{key}:")
+                    out.append(f"{pad}{key}:")
                     for item in v:
                         if isinstance(item, (Mapping, list, tuple)):
-                            lines.append(f"{pad}  -")
-                            lines.append(_yamlify(item, indent + 4))
+                            out.append(item_pad)
+                            _yamlify(item, indent + 4, out, sort_keys)
                         else:
-                            lines.append(f"{pad}  - {_emit_scalar(item)}")
+                            out.append(f"{item_pad} {_emit_scalar(item)}")
             else:
-                lines.append(f"{pad}{key}: {_emit_scalar(v)}")
-        return "\n".join(lines) if lines else f"{pad}{{}}"
+                out.append(f"{pad}{key}: {_emit_scalar(v)}")
+        return
 
     if isinstance(obj, (list, tuple)):
         if not obj:
-            return pad + "[]"
-        lines = []
+            out.append(pad + "[]")
+            return
+        item_pad = pad + "-"
         for item in obj:
             if isinstance(item, (Mapping, list, tuple)):
-                lines.append(f"{pad}-")
-                lines.append(_yamlify(item, indent + 2))
+                out.append(item_pad)
+                _yamlify(item, indent + 2, out, sort_keys)
             else:
-                lines.append(f"{pad}- {_emit_scalar(item)}")
-        return "\n".join(lines)
+                out.append(f"{item_pad} {_emit_scalar(item)}")
+        return
 
     # scalaire
-    return pad + _emit_scalar(obj)
+    out.append(pad + _emit_scalar(obj))
+
+
+def _emit_yaml(obj: Any, sort_keys: bool = False) -> str:
+    """Sérialise `obj` en YAML (un seul tampon de lignes, une seule jointure)."""
+    buf: list[str] = []
+    _yamlify(obj, 0, buf, sort_keys)
+    return "\n".join(buf)
 
 
 def _write_yaml(root: str | Path, name: str, payload: Any) -> Path:
     """Écrit un fichier YAML (`name`) dans `root` et met à jour l’index."""
-    d = _ensure_dir(root)
-    p = d / name
-    p.write_text(_yamlify(payload) + "\n", encoding="utf-8")
+    d = _ensure_dir_str(root)
+    p = os.path.join(d, name)
+    with open(p, "w", encoding="utf-8") as f:
+        f.write(_emit_yaml(payload))
+        f.write("\n")
     _update_index(d, name)
-    return p
+    return Path(p)
 
 
 def _write_text(root: str | Path, name: str, text: str) -> Path:
     """Écrit un fichier texte (`name`) dans `root` et met à jour l’index."""
-    d = _ensure_dir(root)
-    p = d / name
-    p.write_text(text, encoding="utf-8")
+    d = _ensure_dir_str(root)
+    p = os.path.join(d, name)
+    with open(p, "w", encoding="utf-8") as f:
+        f.write(text)
     _update_index(d, name)
-    return p
+    return Path(p)
 
 
 def _append_text(root: str | Path, name: str, line: str) -> Path:
     """Append une ligne à `name` dans `root` (création implicite si absent)."""
-    d = _ensure_dir(root)
-    p = d / name
-    with p.open("a", encoding="utf-8") as f:
+    d = _ensure_dir_str(root)
+    p = os.path.join(d, name)
+    with open(p, "a", encoding="utf-8") as f:
         f.write(line.rstrip("\n") + "\n")
     # append ne modifie pas l’ordre des artefacts (déjà indexé à la création)
-    if not (d / "index.yaml").exists():
+    if not _index_started(d):
         # si append sur fichier inexistant jusque-là (création implicite), indexe-le
         _update_index(d, name)
-    return p
+    return Path(p)
 
 
 # ---------- index YAML ordonné ----------
 
-def _update_index(run_dir: Path, filename: str) -> None:
+# Entrées d’index en attente, par dossier de run (vidées par `flush_index`).
+_INDEX_BUFFERS: Dict[str, List[Tuple[str, str]]] = {}
+
+
+def _index_started(run_dir: str) -> bool:
+    """Indique si l’index du run a déjà au moins une entrée (en tampon ou sur disque)."""
+    return run_dir in _INDEX_BUFFERS or os.path.exists(os.path.join(run_dir, "index.yaml"))
+
+
+def _update_index(run_dir: str, filename: str) -> None:
     """
     Met à jour l’index ordonné du run :
       items:
         - file: patch_before.yaml
           at:   2025-08-12T12:34:56
+
+    L’entrée (horodatée maintenant) est mise en tampon ; `index.yaml` n’est
+    écrit qu’au `flush_index` (fin de run, ou à la sortie du processus).
     """
-    idx = run_dir / "index.yaml"
-    if not idx.exists():
-        idx.write_text("items:\n", encoding="utf-8")
-    with idx.open("a", encoding="utf-8") as f:
-        f.write(f"- file: {filename}\n")
-        f.write(f"  at: {_now_iso()}\n")
+    _INDEX_BUFFERS.setdefault(run_dir, []).append((filename, _now_iso()))
+
+
+def flush_index(run_dir: str | Path) -> None:
+    """Écrit d’un bloc les entrées d’index en attente pour `run_dir` (no-op si aucune)."""
+    d = os.path.normpath(os.fspath(run_dir))
+    entries = _INDEX_BUFFERS.pop(d, None)
+    if not entries:
+        return
+    idx = os.path.join(d, "index.yaml")
+    chunk = "".join(f"- file: {name}\n  at: {at}\n" for name, at in entries)
+    if not os.path.exists(idx):
+        chunk = "items:\n" + chunk
+    with open(idx, "a", encoding="utf-8") as f:
+        f.write(chunk)
+
+
+def flush_all() -> None:
+    """
+    Vide les tampons d’index de tous les runs.
+
+    Enregistré via atexit en filet de sécurité : les appelants écrivent déjà
+    l’index de chaque run à sa fin (`flush_index`).
+    """
+    for d in list(_INDEX_BUFFERS):
+        flush_index(d)
+
+
+atexit.register(flush_all)
 
 
 # ---------- API publique ----------
@@ -266,13 +353,14 @@ def archive_run_info(run_dir: str | Path, **kv: Any) -> Path:
 
     Utile pour “résumer” la session, lisible à l’œil nu.
     """
-    d = _ensure_dir(run_dir)
-    p = d / ".run.kv"
+    d = _ensure_dir_str(run_dir)
+    p = os.path.join(d, ".run.kv")
     # écriture complète (remplace), tri sur les clés pour stabilité
     lines = []
     for k in sorted(kv.keys(), key=str):
         v = kv[k]
         lines.append(f"{k}={v}")
-    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with open(p, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
     _update_index(d, ".run.kv")
-    return p
+    return Path(p)
@@ -180,19 +180,10 @@ class SpecBlock:
             - Assigne des IDs de user stories si absents.
             - Déduplique `functional_objectives`, `input_sources`, `output_targets`.
         """
-        # Déduplication simple, ordre conservé
-        def _dedup(seq: List[str]) -> List[str]:
-            seen = set()
-            out: List[str] = []
-            for x in seq:
-                if x not in seen:
-                    seen.add(x)
-                    out.append(x)
-            return out
-
-        self.functional_objectives = _dedup([s.strip() for s in self.functional_objectives if str(s).strip()])
-        self.input_sources = _dedup([s.strip() for s in self.input_sources if str(s).strip()])
-        self.output_targets = _dedup([s.strip() for s in self.output_targets if str(s).strip()])
+        # Déduplication simple, ordre conservé (dict.fromkeys : stable, sans set auxiliaire)
+        self.functional_objectives = list(dict.fromkeys(filter(None, map(str.strip, self.functional_objectives))))
+        self.input_sources = list(dict.fromkeys(filter(None, map(str.strip, self.input_sources))))
+        self.output_targets = list(dict.fromkeys(filter(None, map(str.strip, self.output_targets))))
 
         # User stories : impose la présence d'un 'id' (US-xxxx)
         normalized_us: List[Dict[str, str]] = []
@@ -14,6 +14,7 @@ from core.archiver import (
     archive_patch_post_commit,
     archive_decision,
     append_console_log,
+    flush_index,
 )
 from core.error_policy import ErrorCategory, map_error_to_next_action  # <-- ajout
 """
@@ -124,67 +125,72 @@ def run_patch_local(
     Returns:
         Tuple (PatchBlock annoté par les checkers, Decision finale).
     """
-    # (A) Archive d’entrée
-    if archive_dir:
-        archive_patch_before(pb, run_dir=archive_dir)
-        append_console_log("[arch] received PatchBlock", run_dir=archive_dir)
-
-    # 1) Vérification + décision
-    pb, decision = verify_and_route(pb)
-
-    # (B) Archive décision + patch annoté par les checkers
-    if archive_dir:
-        archive_decision(decision, run_dir=archive_dir)
-        archive_patch_after(pb, run_dir=archive_dir)
-
-    # 2) Gate policy AVANT APPLY
-    if decision.action == Action.APPLY and policy and diff_stats is not None:
-        ok, violations = policy.evaluate_patch(
-            pb,
-            diff_stats,
-            branch_name=branch_name,
-            partial_ok_count_so_far=partial_ok_count_so_far,
-        )
-        if not ok:
-            action = map_error_to_next_action(ErrorCategory.POLICY_VIOLATION, policy_mode=policy.mode)
-            if action == "rollback":
-                adapters.rollback_and_log(pb, decision)
-                if archive_dir:
-                    append_console_log(
-                        "[policy] BLOCKED: " + " | ".join(violations),
-                        run_dir=archive_dir,
-                    )
-                return pb, decision
-            elif action == "retry":
-                adapters.regenerate_with_acw(pb, decision, reasoner=reasoner)
+    try:
+        # (A) Archive d’entrée
+        if archive_dir:
+            archive_patch_before(pb, run_dir=archive_dir)
+            append_console_log("[arch] received PatchBlock", run_dir=archive_dir)
+
+        # 1) Vérification + décision
+        pb, decision = verify_and_route(pb)
+
+        # (B) Archive décision + patch annoté par les checkers
+        if archive_dir:
+            archive_decision(decision, run_dir=archive_dir)
+            archive_patch_after(pb, run_dir=archive_dir)
+
+        # 2) Gate policy AVANT APPLY
+        if decision.action == Action.APPLY and policy and diff_stats is not None:
+            ok, violations = policy.evaluate_patch(
+                pb,
+                diff_stats,
+                branch_name=branch_name,
+                partial_ok_count_so_far=partial_ok_count_so_far,
+            )
+            if not ok:
+                action = map_error_to_next_action(ErrorCategory.POLICY_VIOLATION, policy_mode=policy.mode)
+                if action == "rollback":
+                    adapters.rollback_and_log(pb, decision)
+                    if archive_dir:
+                        append_console_log(
+                            "[policy] BLOCKED: " + " | ".join(violations),
+                            run_dir=archive_dir,
+                        )
+                    return pb, decision
+                elif action == "retry":
+                    adapters.regenerate_with_acw(pb, decision, reasoner=reasoner)
+                    if archive_dir:
+                        append_console_log(
+                            "[policy] RETRY: " + " | ".join(violations),
+                            run_dir=archive_dir,
+                        )
+                    return pb, decision
+
+            elif not ok and policy.mode == "warn":
                 if archive_dir:
                     append_console_log(
-                        "[policy] RETRY: " + " | ".join(violations),
+                        "[policy] WARN: " + " | ".join(violations),
                         run_dir=archive_dir,
                     )
-                return pb, decision
-
-        elif not ok and policy.mode == "warn":
-            if archive_dir:
-                append_console_log(
-                    "[policy] WARN: " + " | ".join(violations),
-                    run_dir=archive_dir,
-                )
-
-    # 3) Dispatch APPLY/RETRY/ROLLBACK (inchangé)
-    if decision.action == Action.APPLY:
-        adapters.apply_and_commit(pb, decision)
-        # 6) Archive post-commit si l’adaptateur a injecté meta.commit_sha
-        meta = getattr(pb, "meta", None)
-        commit_sha = getattr(meta, "commit_sha", None) if meta else None
-        if archive_dir and commit_sha:
-            archive_patch_post_commit(pb, run_dir=archive_dir)
-    elif decision.action == Action.RETRY:
-        adapters.regenerate_with_acw(pb, decision, reasoner=reasoner)
-    else:
-        adapters.rollback_and_log(pb, decision)
-
-    return pb, decision
+
+        # 3) Dispatch APPLY/RETRY/ROLLBACK (inchangé)
+        if decision.action == Action.APPLY:
+            adapters.apply_and_commit(pb, decision)
+            # 6) Archive post-commit si l’adaptateur a injecté meta.commit_sha
+            meta = getattr(pb, "meta", None)
+            commit_sha = getattr(meta, "commit_sha", None) if meta else None
+            if archive_dir and commit_sha:
+                archive_patch_post_commit(pb, run_dir=archive_dir)
+        elif decision.action == Action.RETRY:
+            adapters.regenerate_with_acw(pb, decision, reasoner=reasoner)
+        else:
+            adapters.rollback_and_log(pb, decision)
+
+        return pb, decision
+    finally:
+        # index.yaml écrit à la fin de chaque traitement (processus long-vivant)
+        if archive_dir:
+            flush_index(archive_dir)
 
 
 # ---------- Adaptateurs par défaut (console/no-op) ----------
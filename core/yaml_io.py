@@ -9,6 +9,11 @@ from datetime import datetime
 
 import yaml
 
+try:  # libyaml (C) si disponible, sinon implémentation pure-Python
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML sans libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from core.types import PatchBlock
 
 
@@ -180,7 +185,7 @@ def load_execution_plan(path: str | Path) -> ExecutionPlan:
         raise FileNotFoundError(f"execution_plan introuvable: {p}")
 
     try:
-        data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+        data = yaml.load(p.read_bytes(), Loader=_SafeLoader) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"YAML invalide ({p}) : {e}") from e
 
@@ -283,6 +283,7 @@ try:
         archive_patch_post_commit,
         append_console_log,
         archive_run_info,
+        flush_index,
     )
 except Exception:
     def archive_execution_plan(text: str, run_dir: str) -> None: ...
@@ -291,6 +292,7 @@ except Exception:
     def archive_patch_post_commit(pb, run_dir: str) -> None: ...
     def append_console_log(msg: str, run_dir: str) -> None: ...
     def archive_run_info(run_dir: str, **kwargs) -> None: ...
+    def flush_index(run_dir: str) -> None: ...
 
 # git adapter (best-effort)
 try:
@@ -386,7 +388,10 @@ def run_plan(
                 append_console_log(f"[git] ensure_branch skipped: {e}", run_dir=run_dir)
             print("• Git indisponible — on continue sans commit")
 
-    # Exécution
+    # Exécution (index des archives déjà produites écrit avant le chdir :
+    # run_dir est relatif au cwd courant)
+    if run_dir:
+        flush_index(run_dir)
     prev_cwd = os.getcwd()
     os.chdir(repo_root)
     try:
@@ -464,6 +469,8 @@ def run_plan(
         else:
             print(f"[DONE] run complet : {produced} patch(s) traités")
     finally:
+        if run_dir:
+            flush_index(run_dir)  # index.yaml complet dès la fin du run
         os.chdir(prev_cwd)
 
 